@@ -2,14 +2,46 @@
 Module for working with Chip's Challenge 1 levels and levelsets.
 Best Practice: Import the parts of your package that you consider to be the "core" public interface.
 """
+import importlib
+
 from .cc1 import CC1
 from .cc1_cell import CC1Cell
+from .cc1_map import CC1Map
 from .cc1_level import CC1Level
 from .cc1_levelset import CC1Levelset
 from .cc1_level_transformer import CC1LevelTransformer
 from .dat_handler import DATHandler
 from .c2m_handler import C2MHandler
 from .tws_handler import TWSHandler
-from .cc1_level_imager import CC1LevelImager
-from .cc1_sprite_set import CC1SpriteSet
-from .cc2_sprite_set import CC2SpriteSet
+
+# The imaging classes pull in PIL, so they are only imported on first access. Parsing and
+# writing levels never pays for it.
+_LAZY_IMPORTS = {
+    "CC1LevelImager": ".cc1_level_imager",
+    "CC1SpriteSet": ".cc1_sprite_set",
+    "CC2SpriteSet": ".cc2_sprite_set",
+}
+
+__all__ = [
+    "CC1",
+    "CC1Cell",
+    "CC1Map",
+    "CC1Level",
+    "CC1Levelset",
+    "CC1LevelTransformer",
+    "DATHandler",
+    "C2MHandler",
+    "TWSHandler",
+    *_LAZY_IMPORTS,
+]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Optional
 
 from cc_tools.c2m_element import C2MElement
@@ -25,9 +25,9 @@ class C2MCell:
         Example:
             C2MCell(mob=C2MElement(id=CC2.CHIP, ...), terrain=C2MElement(id=CC2.FLOOR, ...))
         """
-        fields = [
-            f"{name}={value!r}"
-            for name, value in self.__dict__.items()
-            if value is not None
+        included = [
+            f"{field.name}={value!r}"
+            for field in fields(self)
+            if (value := getattr(self, field.name)) is not None
         ]
-        return f"C2MCell({', '.join(fields)})"
+        return f"C2MCell({', '.join(included)})"
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Optional, List
 
 from cc_tools.cc2 import CC2
@@ -24,9 +24,9 @@ class C2MElement:
     initial_entry: Optional[str] = None
 
     def __repr__(self) -> str:
-        included = []
-        for f in fields(self):  # type: ignore
-            val = getattr(self, f.name)
-            if val is not None:
-                included.append(f"{f.name}={val!r}")
+        included = [
+            f"{field.name}={value!r}"
+            for field in fields(self)
+            if (value := getattr(self, field.name)) is not None
+        ]
         return f"{self.__class__.__name__}({', '.join(included)})"
@@ -34,7 +34,8 @@ Classes:
   - Packer
 """
 
-from collections import defaultdict, namedtuple
+import struct
+from collections import namedtuple
 from dataclasses import dataclass, fields
 from enum import Enum
 from typing import Optional, List
@@ -135,9 +136,61 @@ class C2MConstants:
         PACKED_REPLAY: ParsedField.PACKED_REPLAY,
     }
 
+    # How parse_c2m handles each section tag: (kind, ParsedField it fills or None). One dict
+    # lookup per section yields both the branch to take and the destination field.
+    TEXT_SECTION, BYTE_SECTION, OPTIONS_SECTION, READ_ONLY_SECTION = range(4)
+    SECTION_DISPATCH = {
+        FILE_VERSION: (TEXT_SECTION, ParsedField.FILE_VERSION),
+        LOCK: (TEXT_SECTION, ParsedField.LOCK),
+        TITLE: (TEXT_SECTION, ParsedField.TITLE),
+        AUTHOR: (TEXT_SECTION, ParsedField.AUTHOR),
+        EDITOR_VERSION: (TEXT_SECTION, ParsedField.EDITOR_VERSION),
+        CLUE: (TEXT_SECTION, ParsedField.CLUE),
+        NOTE: (TEXT_SECTION, ParsedField.NOTE),
+        MAP: (BYTE_SECTION, ParsedField.MAP),
+        PACKED_MAP: (BYTE_SECTION, ParsedField.PACKED_MAP),
+        KEY: (BYTE_SECTION, ParsedField.KEY),
+        REPLAY: (BYTE_SECTION, ParsedField.REPLAY),
+        PACKED_REPLAY: (BYTE_SECTION, ParsedField.PACKED_REPLAY),
+        OPTIONS: (OPTIONS_SECTION, None),
+        READ_ONLY: (READ_ONLY_SECTION, None),
+    }
+
+
+# ParsedField values in declaration order; these are the ParsedC2MLevel field names.
+_PARSED_FIELD_VALUES = tuple(f.value for f in C2MConstants.ParsedField)
+
+# OPTIONS section layout: each field in order with its struct format. A section holds some
+# prefix of these fields, so every valid section length maps to one precompiled Struct that
+# decodes the whole section, along with the fields it fills.
+_OPTIONS_FIELDS = (
+    (C2MConstants.ParsedField.TIME, "H"),
+    (C2MConstants.ParsedField.EDITOR_WINDOW, "B"),
+    (C2MConstants.ParsedField.VERIFIED_REPLAY, "B"),
+    (C2MConstants.ParsedField.HIDE_MAP, "B"),
+    (C2MConstants.ParsedField.READ_ONLY_OPTION, "B"),
+    (C2MConstants.ParsedField.REPLAY_HASH, "16s"),
+    (C2MConstants.ParsedField.HIDE_LOGIC, "B"),
+    (C2MConstants.ParsedField.CC1_BOOTS, "B"),
+    (C2MConstants.ParsedField.BLOB_PATTERNS, "B"),
+)
+
+
+def _options_layouts():
+    """Helper: map each valid OPTIONS length to its (Struct, fields) pair."""
+    layouts = {}
+    for count in range(len(_OPTIONS_FIELDS) + 1):
+        prefix = _OPTIONS_FIELDS[:count]
+        options_struct = struct.Struct("<" + "".join(fmt for _, fmt in prefix))
+        layouts[options_struct.size] = (options_struct, tuple(field for field, _ in prefix))
+    return layouts
+
+
+_OPTIONS_LAYOUTS = _options_layouts()
+_OPTIONS_MAX = max(_OPTIONS_LAYOUTS)
 
 # Named tuples for storing parsed information
-ParsedC2MLevel = namedtuple("ParsedC2MLevel", tuple(f.value for f in C2MConstants.ParsedField))
+ParsedC2MLevel = namedtuple("ParsedC2MLevel", _PARSED_FIELD_VALUES)
 
 ParsedC2MLevelset = namedtuple(
     "ParsedC2MLevelset",
@@ -148,6 +201,117 @@ ParsedC2MLevelset = namedtuple(
     ),
 )
 
+# Packed block headers. A data block is a length byte n <= 0x7F followed by n raw bytes; a
+# back-ref block is the byte 0x80 | length followed by the offset byte.
+_DATA_BLOCK_HEADERS = tuple(bytes((n,)) for n in range(0x80))
+_BACK_REF_BLOCK = struct.Struct("<BB")
+
+
+def _unpack_blocks(packed, index, uncompressed_length):
+    """
+    Decompress the blocks of C2M packed data starting at {index}.
+
+    This is the inner loop of C2MHandler.Parser.unpack. It walks {packed} with a plain
+    integer index instead of a Reader, so each block costs a couple of indexing operations.
+    Output is written into one buffer preallocated to the uncompressed length, using slice
+    assignment at a write cursor; data blocks are copied straight from a memoryview of the
+    input without an intermediate bytes object.
+    """
+    packed = memoryview(packed)
+    end = len(packed)
+    out = bytearray(uncompressed_length)
+    pos = 0
+    while pos < uncompressed_length:
+        if index >= end:
+            raise EOFError("Unexpected end of data while reading a byte.")
+        n = packed[index]
+        index += 1
+        if n <= 0x7F:
+            # Data block: copy n raw bytes
+            if index + n > end:
+                raise EOFError(f"Unexpected end of data while reading {n} bytes.")
+            out[pos:pos + n] = packed[index:index + n]
+            index += n
+            pos += n
+        else:
+            # Back Reference block: 'offset' indicates how far back to read
+            if index >= end:
+                raise EOFError("Unexpected end of data while reading a byte.")
+            count = n - 0x80
+            offset = packed[index]
+            index += 1
+            if pos == 0 and count:
+                raise ValueError("Back reference block before any data was written.")
+            # An offset of 0 or past the start refers back to everything written so far.
+            src = pos - offset if 0 < offset <= pos else 0
+            if count <= pos - src:
+                out[pos:pos + count] = out[src:src + count]
+            else:
+                # The reference overlaps the bytes it produces, so its pattern repeats
+                chunk = out[src:pos]
+                out[pos:pos + count] = (chunk * (count // len(chunk) + 1))[:count]
+            pos += count
+    # A final block may run past the declared length; keep it, as the format allows.
+    return bytes(out)
+
+
+def _find_best_match(raw, prev, current_pos):
+    """
+    Find the longest earlier match for the bytes at {current_pos}, for a C2M back reference.
+
+    This is the search loop of C2MHandler.Packer._pack_back_ref_blocks, kept free of reader
+    and writer state so it only touches local ints and the buffers passed in. {raw} is the
+    whole input (a memoryview, so tails are read without copying) and {prev} its 4-byte hash
+    chain. At least 4 bytes must remain at {current_pos}.
+
+    :return: (offset, length) of the best match, or (None, 0) if there is none.
+    """
+    # We'll look forward up to 0x7F bytes from the current position.
+    forward_limit = min(current_pos + 0x7F, len(raw))
+    # We'll look backward up to 0xFF bytes from the current position.
+    backward_limit = max(current_pos - 0xFF, 0)
+
+    best_match_offset = None
+    best_match_length = 0
+    # Matches may extend up to forward_limit; bytes past the first 4 are compared in bulk.
+    max_match_length = forward_limit - current_pos
+    tail_length = max_match_length - 4
+    forward_tail = int.from_bytes(raw[current_pos + 4: forward_limit], "big")
+
+    # Search backward in a 255-byte window to find the longest match, following the hash
+    # chain through each earlier occurrence of the 4-byte candidate (newest first; a match
+    # may run into the current position).
+    search_index = prev[current_pos]
+
+    if search_index == current_pos - 1:
+        # RLE fast path: the 5 bytes from current_pos - 1 are all the same byte, so we are
+        # inside a run. Every window position within the run matches exactly up to the end
+        # of the run, so only the earliest of them needs to be taken; the chain then resumes
+        # below the run, where earlier matches of at least that length can still win.
+        run = raw[current_pos: current_pos + 1]
+        run_end = forward_limit - len(bytes(raw[current_pos: forward_limit]).lstrip(run))
+        run_start = backward_limit + len(bytes(raw[backward_limit: current_pos]).rstrip(run))
+        best_match_length = run_end - current_pos
+        best_match_offset = run_start
+        search_index = prev[run_start]
+
+    while search_index >= backward_limit:
+        # See how far the match extends: XOR the following bytes as big-endian ints, so the
+        # highest set bit marks the first mismatching byte.
+        window_tail = raw[search_index + 4: search_index + 4 + tail_length]
+        mismatch = int.from_bytes(window_tail, "big") ^ forward_tail
+        current_match_length = max_match_length - (mismatch.bit_length() + 7) // 8
+
+        # Update our best match if this one is at least as long; since the chain runs newest
+        # to oldest, the earliest of equally long matches wins.
+        if current_match_length >= best_match_length:
+            best_match_length = current_match_length
+            best_match_offset = search_index
+
+        search_index = prev[search_index]
+
+    return best_match_offset, best_match_length
+
 
 class C2MHandler:
     """
@@ -217,56 +381,35 @@ class C2MHandler:
             :raises ValueError: If an unexpected section tag is encountered.
             """
             parser = C2MHandler.Parser(raw_bytes)
-            parts = defaultdict(lambda: None)
+            # Every field starts out as None; sections present in the file overwrite them.
+            parts = dict.fromkeys(C2MConstants.ParsedField)
 
             # Read 4-byte section tags until we encounter the 'END ' tag
             section = parser.bytes(4)
             while section != C2MConstants.END:
                 length = parser.long()
+                kind, field = C2MConstants.SECTION_DISPATCH.get(section, (None, None))
 
-                if section in C2MConstants.TEXT_FIELDS:
+                if kind == C2MConstants.TEXT_SECTION:
                     # Read a text field
-                    parts[C2MConstants.FIELD_MAP[section]] = parser.text(length)
-                elif section in C2MConstants.BYTE_FIELDS:
+                    parts[field] = parser.text(length)
+                elif kind == C2MConstants.BYTE_SECTION:
                     # Read a raw byte field
-                    parts[C2MConstants.FIELD_MAP[section]] = parser.bytes(length)
-                elif section == C2MConstants.OPTIONS:
-                    # OPTIONS field is read in multiple smaller pieces
-                    read_so_far = 0
-                    if read_so_far < length:
-                        parts[C2MConstants.ParsedField.TIME] = parser.short()
-                        read_so_far += 2
-                    if read_so_far < length:
-                        parts[C2MConstants.ParsedField.EDITOR_WINDOW] = parser.byte()
-                        read_so_far += 1
-                    if read_so_far < length:
-                        parts[C2MConstants.ParsedField.VERIFIED_REPLAY] = parser.byte()
-                        read_so_far += 1
-                    if read_so_far < length:
-                        parts[C2MConstants.ParsedField.HIDE_MAP] = parser.byte()
-                        read_so_far += 1
-                    if read_so_far < length:
-                        parts[C2MConstants.ParsedField.READ_ONLY_OPTION] = parser.byte()
-                        read_so_far += 1
-                    if read_so_far < length:
-                        parts[C2MConstants.ParsedField.REPLAY_HASH] = parser.bytes(16)
-                        read_so_far += 16
-                    if read_so_far < length:
-                        parts[C2MConstants.ParsedField.HIDE_LOGIC] = parser.byte()
-                        read_so_far += 1
-                    if read_so_far < length:
-                        parts[C2MConstants.ParsedField.CC1_BOOTS] = parser.byte()
-                        read_so_far += 1
-                    if read_so_far < length:
-                        parts[C2MConstants.ParsedField.BLOB_PATTERNS] = parser.byte()
-                        read_so_far += 1
-
-                    assert read_so_far == length, (
-                        f"OPTIONS section length mismatch: "
-                        f"expected {length}, read {read_so_far}"
-                    )
-
-                elif section == C2MConstants.READ_ONLY:
+                    parts[field] = parser.bytes(length)
+                elif kind == C2MConstants.OPTIONS_SECTION:
+                    # OPTIONS holds a prefix of a fixed field layout; decode it in one call.
+                    layout = _OPTIONS_LAYOUTS.get(length)
+                    if layout is None:
+                        read_so_far = next(
+                            (end for end in _OPTIONS_LAYOUTS if end > length), _OPTIONS_MAX)
+                        raise AssertionError(
+                            f"OPTIONS section length mismatch: "
+                            f"expected {length}, read {read_so_far}"
+                        )
+                    options_struct, options_fields = layout
+                    parts.update(zip(options_fields, options_struct.unpack(parser.bytes(length))))
+
+                elif kind == C2MConstants.READ_ONLY_SECTION:
                     # READ_ONLY has length == 0
                     assert length == 0, (
                         "READ_ONLY section must have length 0, "
@@ -281,8 +424,9 @@ class C2MHandler:
 
                 section = parser.bytes(4)
 
-            # Return a namedtuple in the same order as C2MConstants.ParsedField
-            return ParsedC2MLevel(*(parts[field] for field in C2MConstants.ParsedField))
+            # parts was seeded in C2MConstants.ParsedField order and assignments keep that
+            # order, so its values are already the namedtuple fields in sequence.
+            return ParsedC2MLevel._make(parts.values())
 
         @staticmethod
         def unpack(packed_bytes: bytes) -> bytes:
@@ -292,34 +436,11 @@ class C2MHandler:
             :param packed_bytes: Data compressed using C2M compression rules.
             :return: Uncompressed data as raw bytes.
             """
-            parser = C2MHandler.Parser(packed_bytes)
-            writer = C2MHandler.Writer()
-
+            if len(packed_bytes) < 2:
+                raise EOFError("Unexpected end of data while reading a short.")
             # The first two bytes represent the uncompressed length
-            uncompressed_length = parser.short()
-
-            while len(writer.written()) < uncompressed_length:
-                n = parser.byte()
-                if n <= 0x7F:
-                    # Data block: read n raw bytes
-                    writer.bytes(parser.bytes(n))
-                else:
-                    # Back Reference block
-                    count = n - 0x80
-                    offset = parser.byte()
-
-                    # The 'offset' indicates how far back to read
-                    # from the already-written data
-                    previously_written = writer.written()[-offset:]
-                    chunk = previously_written
-
-                    # Ensure the chunk covers 'count' bytes
-                    while len(chunk) < count:
-                        chunk += previously_written
-
-                    writer.bytes(chunk[:count])
-
-            return writer.written()
+            uncompressed_length = int.from_bytes(packed_bytes[:2], "little")
+            return _unpack_blocks(packed_bytes, 2, uncompressed_length)
 
     class Writer(CCBinary.Writer):
         """
@@ -443,6 +564,24 @@ class C2MHandler:
         def __init__(self):
             self.reader = None
             self.writer = None
+            # Hash chain over the input: prev[p] is the most recent position before p that
+            # starts with the same 4 bytes as p, or -1. Walking it visits exactly the
+            # earlier occurrences of a 4-byte prefix, newest first.
+            self.prev = None
+
+        @staticmethod
+        def _build_hash_chain(raw):
+            """
+            Build the prev[] hash chain for every position that starts a full 4-byte
+            substring of raw.
+            """
+            head = {}
+            prev = []
+            for p in range(len(raw) - 3):
+                key = raw[p: p + 4]
+                prev.append(head.get(key, -1))
+                head[key] = p
+            return prev
 
         @staticmethod
         def pack(unpacked_bytes: bytes) -> bytes:
@@ -455,6 +594,7 @@ class C2MHandler:
             packer = C2MHandler.Packer()
             packer.reader = C2MHandler.Parser(unpacked_bytes)
             packer.writer = C2MHandler.Writer()
+            packer.prev = C2MHandler.Packer._build_hash_chain(packer.reader.raw())
 
             # First, write the uncompressed length (2 bytes, short)
             packer.writer.short(packer.reader.size())
@@ -471,47 +611,36 @@ class C2MHandler:
             Pack one or more 'data blocks' according to C2M compression rules.
             A data block is indicated by a byte n <= 0x7F, followed by n raw bytes.
             """
-            start_index = self.reader.current()
-            # Up to 127 unprocessed bytes
-            chunk = self.reader.raw()[start_index : start_index + 0x7F]
-
-            if len(chunk) == 0:
-                return  # Nothing to pack
-
-            seen_substrings = set()
-            offset_limit = max(start_index - 0xFF, 0)
-            max_seen_index = start_index
-
-            # Collect previously seen 4-byte substrings within a 255-byte window
-            for i in range(offset_limit, start_index):
-                substring = self.reader.raw()[i : i + 4]
-                if len(substring) == 4:
-                    seen_substrings.add(substring)
-
-            # We'll try to find the first 4-byte substring in `chunk` that we've
-            # already seen, so we know where a back-ref block might start.
-            for i in range(len(chunk) - 4):
-                # Add new 4-byte substrings that come into range
-                for j in range(max_seen_index, start_index + i):
-                    sub4 = self.reader.raw()[j : j + 4]
-                    if len(sub4) == 4:
-                        seen_substrings.add(sub4)
-                max_seen_index = start_index + i
-
-                current_sub4 = chunk[i : i + 4]
-                if current_sub4 in seen_substrings:
-                    # We've hit a repeat substring; write all data bytes up to here
-                    if i > 0:
-                        self.writer.byte(i)  # length of data block
-                        self.writer.bytes(self.reader.bytes(i))
-                    return
-
-            # If no repeats found in the chunk, write out all of it as a data block
-            self.writer.byte(len(chunk))
-            self.writer.bytes(self.reader.bytes(len(chunk)))
-
-            # Attempt to pack more data blocks recursively
-            self._pack_data_blocks()
+            prev = self.prev
+            raw = self.reader.raw()
+
+            # Emit full 127-byte data blocks until one contains a repeat or input runs out.
+            while True:
+                start_index = self.reader.current()
+                # Up to 127 unprocessed bytes
+                chunk_length = min(len(raw) - start_index, 0x7F)
+
+                if chunk_length <= 0:
+                    return  # Nothing to pack
+
+                offset_limit = max(start_index - 0xFF, 0)
+
+                # We'll try to find the first 4-byte substring in the chunk that already
+                # appeared in the window [offset_limit, its own position), so we know where a
+                # back-ref block might start. The hash chain gives its latest earlier occurrence.
+                for i in range(chunk_length - 4):
+                    if prev[start_index + i] >= offset_limit:
+                        # We've hit a repeat substring; write all data bytes up to here
+                        if i > 0:
+                            self._write_data_block(i)
+                        return
+
+                # If no repeats found in the chunk, write out all of it as a data block
+                self._write_data_block(chunk_length)
+
+        def _write_data_block(self, length):
+            """Write the next `length` unread bytes as one data block: header and payload."""
+            self.writer.bytes(_DATA_BLOCK_HEADERS[length] + self.reader.bytes(length))
 
         def _pack_back_ref_blocks(self):
             """
@@ -527,51 +656,15 @@ class C2MHandler:
                 return
 
             current_pos = self.reader.current()
-            # We'll look forward up to 0x7F bytes from the current position.
-            forward_limit = min(current_pos + 0x7F, self.reader.size())
-            # We'll look backward up to 0xFF bytes from the current position.
-            backward_limit = max(current_pos - 0xFF, 0)
-
-            # The candidate substring is the next 4 bytes at the current reader position.
-            candidate_substring = self.reader.raw()[current_pos: current_pos + 4]
-
-            best_match_offset = None
-            best_match_length = 0
-
-            # Search backward in a 255-byte window to find the longest match.
-            search_index = backward_limit
-            while search_index < current_pos:
-                window_substring = self.reader.raw()[search_index: search_index + 4]
-
-                # If the 4-byte window matches our candidate, see how far it extends.
-                if window_substring == candidate_substring:
-                    forward_index = current_pos + 4
-                    window_index = search_index + 4
-
-                    # Continue matching bytes while within forward_limit.
-                    while (
-                            forward_index < forward_limit
-                            and self.reader.raw()[window_index] == self.reader.raw()[forward_index]
-                    ):
-                        forward_index += 1
-                        window_index += 1
-
-                    # Calculate the total length of the matched substring.
-                    current_match_length = forward_index - current_pos
-
-                    # Update our best match if this one is longer.
-                    if current_match_length > best_match_length:
-                        best_match_length = current_match_length
-                        best_match_offset = search_index
-
-                search_index += 1
+            best_match_offset, best_match_length = _find_best_match(
+                memoryview(self.reader.raw()), self.prev, current_pos)
 
             # If a match was found, write the back-ref block.
             if best_match_length > 0 and best_match_offset is not None:
-                # The byte n is 0x80 + match_length.
-                self.writer.byte(0x80 | best_match_length)
-                # The offset is how far back from the current position the match begins.
-                self.writer.byte(current_pos - best_match_offset)
+                # The byte n is 0x80 + match_length, then the offset is how far back from the
+                # current position the match begins.
+                self.writer.bytes(_BACK_REF_BLOCK.pack(
+                    0x80 | best_match_length, current_pos - best_match_offset))
                 # Advance the reader by the length of the matched block.
                 self.reader.seek(current_pos + best_match_length)
 
@@ -5,6 +5,22 @@ from cc_tools.c2m_element import C2MElement
 from cc_tools.c2m_modifiers import C2MModifiers
 from cc_tools.cc2 import CC2
 
+# The CC2 category helpers build fresh sets on every call, so take them once here.
+_ALL_MOBS = frozenset(CC2.all_mobs())
+_MODIFIERS = frozenset(CC2.modifiers())
+# The C2MCell layer each tile is stored on; anything not listed is terrain. Later entries
+# win, matching the panel -> mob -> not_allowed -> pickup precedence of decode().
+_CELL_LAYERS = {
+    **dict.fromkeys(CC2.pickups(), "pickup"),
+    CC2.NOT_ALLOWED_MARKER: "not_allowed",
+    **dict.fromkeys(_ALL_MOBS, "mob"),
+    **dict.fromkeys(CC2.panels(), "panel"),
+}
+# Codes that are a whole cell on their own: terrain with no extra bytes, which is most of a map.
+_PLAIN_TERRAIN = {
+    tile.value: tile for tile in CC2 if tile not in _CELL_LAYERS and tile not in _MODIFIERS
+}
+
 
 class C2MMapDecoder:
     """
@@ -40,24 +56,22 @@ class C2MMapDecoder:
         cells_2d: List[List[C2MCell]] = []
 
         # 2: read each tile specification
+        data = self.data
         for y in range(height):
             row: List[C2MCell] = []
             for x in range(width):
+                # Fast path: a single plain terrain byte needs no further parsing.
+                tile = _PLAIN_TERRAIN.get(data[self.offset]) if self.offset < len(data) else None
+                if tile is not None:
+                    self.offset += 1
+                    row.append(C2MCell(terrain=C2MElement(tile)))
+                    continue
                 cell = C2MCell()
                 # We loop until we have assigned 'terrain' because the logic
                 # indicates that once 'terrain' is set, we stop reading further tiles for this cell.
                 while cell.terrain is None:
                     elem = self._parse_elem()
-                    if elem.id in CC2.panels():
-                        cell.panel = elem
-                    elif elem.id in CC2.all_mobs():
-                        cell.mob = elem
-                    elif elem.id == CC2.NOT_ALLOWED_MARKER:
-                        cell.not_allowed = elem
-                    elif elem.id in CC2.pickups():
-                        cell.pickup = elem
-                    else:
-                        cell.terrain = elem
+                    setattr(cell, _CELL_LAYERS.get(elem.id, "terrain"), elem)
                 row.append(cell)
             cells_2d.append(row)
 
@@ -114,7 +128,7 @@ class C2MMapDecoder:
         elem = C2MElement(tile_id)
 
         # 2: Check if we need to parse direction, canopy, or other modifiers:
-        if tile_id in CC2.all_mobs():
+        if tile_id in _ALL_MOBS:
             # e.g. read direction
             C2MModifiers.parse_direction(elem, self._read_bytes(1))
             if tile_id == CC2.DIRECTIONAL_BLOCK:
@@ -124,7 +138,7 @@ class C2MMapDecoder:
         elif tile_id == CC2.THIN_WALL_CANOPY:
             C2MModifiers.parse_thinwall_canopy(elem, self._read_bytes(1))
 
-        elif tile_id in CC2.modifiers():
+        elif tile_id in _MODIFIERS:
             # For certain tiles, we read a specified number of bytes as the modifier
             #  and then parse another element (the tile being modified).
             if tile_id == CC2.MODIFIER_8BIT:
@@ -4,6 +4,10 @@ from cc_tools.c2m_element import C2MElement
 from cc_tools.c2m_modifiers import C2MModifiers
 from cc_tools.cc2 import CC2
 
+# The CC2 category helpers build fresh sets on every call, so take them once here.
+_ALL_MOBS = frozenset(CC2.all_mobs())
+_MODIFIED_TILES = frozenset(CC2.modified_tiles())
+
 
 class C2MMapEncoder:
     """
@@ -74,7 +78,7 @@ class C2MMapEncoder:
         tile_id = elem.id
 
         # 1) If tile is a mob => (ID, direction, maybe arrows)
-        if tile_id in CC2.all_mobs():
+        if tile_id in _ALL_MOBS:
             out.append(tile_id.value)  # 1 byte ID
             # direction
             dir_bytes = C2MModifiers.build_direction(elem)
@@ -91,7 +95,7 @@ class C2MMapEncoder:
             out += canopy_bytes
 
         # 3) If tile is a modified tile => (modifier ID, modifier_bytes, ID)
-        elif tile_id in CC2.modified_tiles():
+        elif tile_id in _MODIFIED_TILES:
             # 1) Build the raw modifier bytes (1, 2, or 4 bytes) for this tile
             mod_bytes = C2MModifiers.build_modifier(elem)
 
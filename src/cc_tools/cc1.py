@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import Enum, IntEnum
 
 # ----------------------------------------------------------------------
 # Enhanced flipping logic
@@ -60,8 +60,18 @@ FLIP_NW_SE_MAP = {
     "SW": "SW",  # SW remains SW
 }
 
-class CC1(Enum):
-    """Enumeration of tile codes used in CC1 DAT files, and associated utils."""
+# Every direction suffix a CC1 tile name may carry, plus "" for directionless tiles.
+_DIRECTIONS = ("", "N", "E", "S", "W", "NE", "NW", "SE", "SW")
+
+
+class CC1(IntEnum):
+    """Enumeration of tile codes used in CC1 DAT files, and associated utils. Members are ints
+    (their DAT tile code), so they can be compared, stored in byte planes, and used as indices
+    directly."""
+
+    # Keep the "CC1.FLOOR" rendering of a plain Enum rather than IntEnum's bare integer.
+    __str__ = Enum.__str__
+    __format__ = Enum.__format__
 
     FLOOR = 0
     WALL = 1
@@ -182,54 +192,41 @@ class CC1(Enum):
 
     def dirs(self):
         """Return the cardinal direction(s) associated with this element."""
-        suffix = self.name.rsplit('_', maxsplit=1)[-1]
-        return suffix if suffix in ("N", "E", "S", "W", "NE", "NW", "SE", "SW") else ""
+        return _DIRS[self]
 
     def with_dirs(self, dirs):
         """Returns the same element but with the cardinal direction(s) replaced by {dirs} if
         possible. Throws if invalid operation."""
-        if dirs not in ("", "N", "E", "S", "W", "NE", "NW", "SE", "SW"):
+        replaced = _WITH_DIRS.get((self, dirs))
+        if replaced is not None:
+            return replaced
+        # Not a legal replacement; work out which error to raise.
+        if dirs not in _DIRECTIONS:
             raise ValueError(f"illegal direction(s) specified: {dirs}")
         if len(self.dirs()) != len(dirs):
             raise ValueError(f"lengths unequal: self: {len(self.dirs())} vs given: {dirs}")
-        if not dirs:
-            return self
+        # No such member, e.g. PANEL_SE has no PANEL_SW; raises KeyError.
         return CC1[self.name[:-len(dirs)] + dirs]
 
     def right(self):
         """Rotate this tile’s direction(s) 90° clockwise."""
-        dir_suffix = self.dirs()
-        # No direction => unchanged; skip certain exceptions if you want them unchanged:
-        if not dir_suffix or self == CC1.PANEL_SE or self == CC1.FORCE_RANDOM:
-            return self
-
-        new_dirs = ""
-        for d in dir_suffix:
-            # Using the 'NESW' circular buffer: index(d)+1 => rotate right
-            new_dirs = "NESW"[("NESW".index(d) + 1) % 4] + new_dirs
-        return self.with_dirs(new_dirs)
+        return _RIGHT[self]
 
     def reverse(self):
         """Reverse the tile’s direction(s), i.e. 180° turn (two rights)."""
-        return self.right().right()
+        return _REVERSE[self]
 
     def left(self):
         """Rotate this tile’s direction(s) 90° counterclockwise (three rights)."""
-        return self.right().right().right()
+        return _LEFT[self]
 
     def flip_horizontal(self):
         """Flip horizontally: E <-> W, NE <-> NW, SE <-> SW, etc."""
-        if not self.dirs():
-            return self
-        flipped = FLIP_HORIZONTAL_MAP[self.dirs()]
-        return self.with_dirs(flipped)
+        return _FLIP_HORIZONTAL[self]
 
     def flip_vertical(self):
         """Flip vertically: N <-> S, NE <-> SE, NW <-> SW, etc."""
-        if not self.dirs():
-            return self
-        flipped = FLIP_VERTICAL_MAP[self.dirs()]
-        return self.with_dirs(flipped)
+        return _FLIP_VERTICAL[self]
 
     def flip_ne_sw(self):
         """
@@ -240,10 +237,7 @@ class CC1(Enum):
           - SE <-> SW
           - NW stays NW
         """
-        if not self.dirs():
-            return self
-        flipped = FLIP_NE_SW_MAP[self.dirs()]
-        return self.with_dirs(flipped)
+        return _FLIP_NE_SW[self]
 
     def flip_nw_se(self):
         """
@@ -254,172 +248,308 @@ class CC1(Enum):
           - SE stays SE
           - SW stays SW
         """
-        if not self.dirs():
-            return self
-        flipped = FLIP_NW_SE_MAP[self.dirs()]
-        return self.with_dirs(flipped)
+        return _FLIP_NW_SE[self]
 
     # ----------------------------------------------------------------------
     # Class methods returning sets
     # ----------------------------------------------------------------------
-
-    @classmethod
-    def __compass(cls, prefix):
-        """Helper: {prefix}_N, {prefix}_E, {prefix}_S, {prefix}_W."""
-        return {cls[prefix + "_" + d] for d in "NESW"}
+    # Each category is built once at import time (see below the class body) and
+    # returned as a shared frozenset, so membership tests in hot loops never
+    # rebuild sets.
 
     @classmethod
     def all(cls):
         """Return a set of all CC1 tile codes."""
-        return set(cls)
+        return _ALL
 
     @classmethod
     def invalid(cls):
         """Return a set of all invalid CC1 tiles."""
-        return {
-            cls.NOT_USED_0, cls.DROWN_CHIP, cls.BURNED_CHIP0, cls.BURNED_CHIP1,
-            cls.NOT_USED_1, cls.NOT_USED_2, cls.NOT_USED_3, cls.CHIP_EXIT,
-            cls.UNUSED_EXIT_0, cls.UNUSED_EXIT_1,
-            cls.CHIP_SWIMMING_N, cls.CHIP_SWIMMING_E,
-            cls.CHIP_SWIMMING_S, cls.CHIP_SWIMMING_W,
-        }
+        return _INVALID
 
     @classmethod
     def valid(cls):
         """Return a set of all valid CC1 tiles."""
-        return cls.all().difference(cls.invalid())
+        return _VALID
 
     @classmethod
     def ice(cls):
         """Return a set of all CC1 ice and ice corner tiles."""
-        return {cls.ICE} | {cls["ICE_" + d] for d in ("NE", "NW", "SE", "SW")}
+        return _ICE
 
     @classmethod
     def forces(cls):
         """Return a set of all CC1 force floor tiles."""
-        return {cls.FORCE_RANDOM} | cls.__compass("FORCE")
+        return _FORCES
 
     @classmethod
     def walls(cls):
         """Return a set of all CC1 wall tiles."""
-        return {cls.WALL, cls.INV_WALL_PERM, cls.INV_WALL_APP, cls.BLUE_WALL_REAL}
+        return _WALLS
 
     @classmethod
     def panels(cls):
         """Return a set of all CC1 panel (thin wall) tiles."""
-        return {cls.PANEL_SE} | cls.__compass("PANEL")
+        return _PANELS
 
     @classmethod
     def clone_blocks(cls):
         """Return a set of all CC1 clone block tiles."""
-        return cls.__compass("CLONE_BLOCK")
+        return _CLONE_BLOCKS
 
     @classmethod
     def blocks(cls):
         """Return a set of all CC1 block and clone block tiles."""
-        return cls.clone_blocks() | {cls.BLOCK}
+        return _BLOCKS
 
     @classmethod
     def players(cls):
         """Return a set of all CC1 player tiles."""
-        return cls.__compass("PLAYER")
+        return _PLAYERS
 
     @classmethod
     def ants(cls):
         """Return a set of all CC1 ant (spider) tiles."""
-        return cls.__compass("ANT")
+        return _ANTS
 
     @classmethod
     def paramecia(cls):
         """Return a set of all CC1 paramecium tiles."""
-        return cls.__compass("PARAMECIUM")
+        return _PARAMECIA
 
     @classmethod
     def gliders(cls):
         """Return a set of all CC1 glider tiles."""
-        return cls.__compass("GLIDER")
+        return _GLIDERS
 
     @classmethod
     def fireballs(cls):
         """Return a set of all CC1 fireball tiles."""
-        return cls.__compass("FIREBALL")
+        return _FIREBALLS
 
     @classmethod
     def tanks(cls):
         """Return a set of all CC1 tank tiles."""
-        return cls.__compass("TANK")
+        return _TANKS
 
     @classmethod
     def balls(cls):
         """Return a set of all CC1 ball tiles."""
-        return cls.__compass("BALL")
+        return _BALLS
 
     @classmethod
     def walkers(cls):
         """Return a set of all CC1 walker tiles."""
-        return cls.__compass("WALKER")
+        return _WALKERS
 
     @classmethod
     def teeth(cls):
         """Return a set of all CC1 teeth tiles."""
-        return cls.__compass("TEETH")
+        return _TEETH
 
     @classmethod
     def blobs(cls):
         """Return a set of all CC1 blob tiles."""
-        return cls.__compass("BLOB")
+        return _BLOBS
 
     @classmethod
     def monsters(cls):
         """Return a set of all CC1 monster tiles."""
-        return (
-            cls.gliders()
-            | cls.ants()
-            | cls.paramecia()
-            | cls.fireballs()
-            | cls.teeth()
-            | cls.tanks()
-            | cls.blobs()
-            | cls.walkers()
-            | cls.balls()
-        )
+        return _MONSTERS
 
     @classmethod
     def mobs(cls):
         """Return a set of all CC1 monster, block, and player tiles."""
-        return cls.monsters() | cls.blocks() | cls.players()
+        return _MOBS
 
     @classmethod
     def nonmobs(cls):
         """Return a set of all CC1 tiles that are not monsters, blocks, or players."""
-        return cls.all().difference(cls.mobs())
+        return _NONMOBS
 
     @classmethod
     def doors(cls):
         """Return a set of all CC1 door tiles."""
-        return {cls.RED_DOOR, cls.GREEN_DOOR, cls.YELLOW_DOOR, cls.BLUE_DOOR}
+        return _DOORS
 
     @classmethod
     def keys(cls):
         """Return a set of all CC1 key tiles."""
-        return {cls.RED_KEY, cls.GREEN_KEY, cls.YELLOW_KEY, cls.BLUE_KEY}
+        return _KEYS
 
     @classmethod
     def boots(cls):
         """Return a set of all CC1 boot tiles."""
-        return {cls.SKATES, cls.SUCTION_BOOTS, cls.FIRE_BOOTS, cls.FLIPPERS}
+        return _BOOTS
 
     @classmethod
     def pickups(cls):
         """Return a set of all CC1 boot, key, and chip tiles."""
-        return cls.boots() | cls.keys() | {cls.CHIP}
+        return _PICKUPS
 
     @classmethod
     def buttons(cls):
         """Return a set of all CC1 button tiles."""
-        return {cls.GREEN_BUTTON, cls.TRAP_BUTTON, cls.CLONE_BUTTON, cls.TANK_BUTTON}
+        return _BUTTONS
 
     @classmethod
     def toggles(cls):
         """Return a set of all CC1 toggle tiles."""
-        return {cls.TOGGLE_WALL, cls.TOGGLE_FLOOR}
+        return _TOGGLES
+
+
+# ----------------------------------------------------------------------
+# Precomputed tile categories
+# ----------------------------------------------------------------------
+
+
+def _compass(prefix):
+    """Helper: {prefix}_N, {prefix}_E, {prefix}_S, {prefix}_W."""
+    return frozenset(CC1[prefix + "_" + d] for d in "NESW")
+
+
+_ALL = frozenset(CC1)
+# Members indexed by tile code (codes are the contiguous range 0-111).
+_TILES = tuple(sorted(CC1))
+_INVALID = frozenset({
+    CC1.NOT_USED_0, CC1.DROWN_CHIP, CC1.BURNED_CHIP0, CC1.BURNED_CHIP1,
+    CC1.NOT_USED_1, CC1.NOT_USED_2, CC1.NOT_USED_3, CC1.CHIP_EXIT,
+    CC1.UNUSED_EXIT_0, CC1.UNUSED_EXIT_1,
+    CC1.CHIP_SWIMMING_N, CC1.CHIP_SWIMMING_E,
+    CC1.CHIP_SWIMMING_S, CC1.CHIP_SWIMMING_W,
+})
+_VALID = _ALL - _INVALID
+_ICE = frozenset({CC1.ICE, CC1.ICE_NE, CC1.ICE_NW, CC1.ICE_SE, CC1.ICE_SW})
+_FORCES = frozenset({CC1.FORCE_RANDOM}) | _compass("FORCE")
+_WALLS = frozenset({CC1.WALL, CC1.INV_WALL_PERM, CC1.INV_WALL_APP, CC1.BLUE_WALL_REAL})
+_PANELS = frozenset({CC1.PANEL_SE}) | _compass("PANEL")
+_CLONE_BLOCKS = _compass("CLONE_BLOCK")
+_BLOCKS = _CLONE_BLOCKS | {CC1.BLOCK}
+_PLAYERS = _compass("PLAYER")
+_ANTS = _compass("ANT")
+_PARAMECIA = _compass("PARAMECIUM")
+_GLIDERS = _compass("GLIDER")
+_FIREBALLS = _compass("FIREBALL")
+_TANKS = _compass("TANK")
+_BALLS = _compass("BALL")
+_WALKERS = _compass("WALKER")
+_TEETH = _compass("TEETH")
+_BLOBS = _compass("BLOB")
+_MONSTERS = (
+    _GLIDERS | _ANTS | _PARAMECIA | _FIREBALLS | _TEETH | _TANKS | _BLOBS | _WALKERS | _BALLS
+)
+_MOBS = _MONSTERS | _BLOCKS | _PLAYERS
+_NONMOBS = _ALL - _MOBS
+_DOORS = frozenset({CC1.RED_DOOR, CC1.GREEN_DOOR, CC1.YELLOW_DOOR, CC1.BLUE_DOOR})
+_KEYS = frozenset({CC1.RED_KEY, CC1.GREEN_KEY, CC1.YELLOW_KEY, CC1.BLUE_KEY})
+_BOOTS = frozenset({CC1.SKATES, CC1.SUCTION_BOOTS, CC1.FIRE_BOOTS, CC1.FLIPPERS})
+_PICKUPS = _BOOTS | _KEYS | {CC1.CHIP}
+_BUTTONS = frozenset({CC1.GREEN_BUTTON, CC1.TRAP_BUTTON, CC1.CLONE_BUTTON, CC1.TANK_BUTTON})
+_TOGGLES = frozenset({CC1.TOGGLE_WALL, CC1.TOGGLE_FLOOR})
+
+# Per-code category bit flags for the checks that combine several categories at once.
+# Indexed by tile code; the table covers every byte value so codes outside 0-111 read as
+# invalid, and it can be passed straight to bytes.translate() to classify a whole layer.
+_MOB_FLAG = 0x01
+_MONSTER_FLAG = 0x02
+_INVALID_FLAG = 0x04
+_CATEGORY_FLAGS = bytes(
+    (_MOB_FLAG if code in _MOBS else 0)
+    | (_MONSTER_FLAG if code in _MONSTERS else 0)
+    | (_INVALID_FLAG if code in _INVALID or code not in _ALL else 0)
+    for code in range(256)
+)
+
+
+# ----------------------------------------------------------------------
+# Precomputed direction suffixes
+# ----------------------------------------------------------------------
+
+
+def _dirs_from_name(member):
+    """Helper: parse the direction suffix from a member name, e.g. ICE_NE -> NE."""
+    suffix = member.name.rsplit('_', maxsplit=1)[-1]
+    return suffix if suffix in _DIRECTIONS else ""
+
+
+_DIRS = {member: _dirs_from_name(member) for member in CC1}
+
+
+def _with_dirs_table():
+    """Helper: map (member, dirs) to the member with its direction(s) replaced, for every
+    replacement that names an existing member."""
+    table = {}
+    for member in CC1:
+        for dirs in _DIRECTIONS:
+            if len(dirs) != len(_DIRS[member]):
+                continue
+            name = member.name[:-len(dirs)] + dirs if dirs else member.name
+            if name in CC1.__members__:
+                table[member, dirs] = CC1[name]
+    return table
+
+
+_WITH_DIRS = _with_dirs_table()
+
+
+# ----------------------------------------------------------------------
+# Precomputed rotation / flip tables
+# ----------------------------------------------------------------------
+# There are only 112 members, so every rotation and flip is resolved once at
+# import time and the methods above are single dict lookups.
+
+
+def _compute_right(member):
+    """Helper: rotate a member's direction(s) 90° clockwise by name."""
+    dir_suffix = _DIRS[member]
+    # No direction => unchanged; skip certain exceptions if you want them unchanged:
+    if not dir_suffix or member == CC1.PANEL_SE or member == CC1.FORCE_RANDOM:
+        return member
+
+    new_dirs = ""
+    for d in dir_suffix:
+        # Using the 'NESW' circular buffer: index(d)+1 => rotate right
+        new_dirs = "NESW"[("NESW".index(d) + 1) % 4] + new_dirs
+    return member.with_dirs(new_dirs)
+
+
+def _flip_table(flip_map):
+    """Helper: build a member -> flipped member table from one of the FLIP_* maps.
+    Members without a flipped counterpart (PANEL_SE has no PANEL_SW/PANEL_NE) are left
+    out, so looking them up raises KeyError just as the name lookup used to."""
+    table = {}
+    for member in CC1:
+        dirs = _DIRS[member]
+        try:
+            table[member] = member.with_dirs(flip_map[dirs]) if dirs else member
+        except KeyError:
+            pass
+    return table
+
+
+_RIGHT = {member: _compute_right(member) for member in CC1}
+_REVERSE = {member: _RIGHT[_RIGHT[member]] for member in CC1}
+_LEFT = {member: _RIGHT[_REVERSE[member]] for member in CC1}
+_FLIP_HORIZONTAL = _flip_table(FLIP_HORIZONTAL_MAP)
+_FLIP_VERTICAL = _flip_table(FLIP_VERTICAL_MAP)
+_FLIP_NE_SW = _flip_table(FLIP_NE_SW_MAP)
+_FLIP_NW_SE = _flip_table(FLIP_NW_SE_MAP)
+
+
+def _code_table(table):
+    """Helper: turn a member -> member table into a 256-byte table for bytes.translate(), so
+    a whole map layer can be transformed at once. Codes the table leaves out map to
+    themselves."""
+    codes = bytearray(range(256))
+    for member, result in table.items():
+        codes[member] = result
+    return bytes(codes)
+
+
+_RIGHT_CODES = _code_table(_RIGHT)
+_REVERSE_CODES = _code_table(_REVERSE)
+_LEFT_CODES = _code_table(_LEFT)
+_FLIP_HORIZONTAL_CODES = _code_table(_FLIP_HORIZONTAL)
+_FLIP_VERTICAL_CODES = _code_table(_FLIP_VERTICAL)
+_FLIP_NE_SW_CODES = _code_table(_FLIP_NE_SW)
+_FLIP_NW_SE_CODES = _code_table(_FLIP_NW_SE)
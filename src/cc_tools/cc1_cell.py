@@ -1,48 +1,91 @@
 """Class that represents a single CC1 cell with a top and bottom element."""
-from .cc1 import CC1
+from .cc1 import CC1, _TILES, _CATEGORY_FLAGS, _MOB_FLAG, _INVALID_FLAG
+
+# Packed layers -> str(cell), filled lazily (at most 112 * 112 entries).
+_RENDERED = {}
 
 
 class CC1Cell:
-    """Class that represents a single CC1 cell with a top and bottom element."""
+    """Class that represents a single CC1 cell with a top and bottom element.
+
+    Both layers are packed into one 16-bit int, top | bottom << 8, so equality and
+    containment are plain integer comparisons."""
+
+    __slots__ = ("_packed",)
 
     def __init__(self, top=CC1.FLOOR, bottom=CC1.FLOOR):
-        self.top, self.bottom = top, bottom
+        self._packed = top | bottom << 8
+
+    @property
+    def top(self):
+        """Top layer element."""
+        try:
+            return _TILES[self._packed & 0xFF]
+        except IndexError:
+            return CC1(self._packed & 0xFF)  # No such element: raises ValueError, as before.
+
+    @top.setter
+    def top(self, elem):
+        self._packed = self._packed & 0xFF00 | elem
+
+    @property
+    def bottom(self):
+        """Bottom layer element."""
+        try:
+            return _TILES[self._packed >> 8]
+        except IndexError:
+            return CC1(self._packed >> 8)  # No such element: raises ValueError, as before.
+
+    @bottom.setter
+    def bottom(self, elem):
+        self._packed = self._packed & 0xFF | elem << 8
 
     def __copy__(self):
-        return CC1Cell(self.top, self.bottom)
+        packed = self._packed
+        return CC1Cell(packed & 0xFF, packed >> 8)
 
     def __eq__(self, other):
-        return (self.top, self.bottom) == (other.top, other.bottom)
+        return self._packed == other._packed
+
+    # Cells are mutable, so they stay unhashable like before.
+    __hash__ = None
 
     def __str__(self):
-        return f"{{CC1Cell top={self.top} bottom={self.bottom}}}"
+        # Rendered once per distinct (top, bottom) pair. Keying on the packed layers rather
+        # than the instance keeps this correct however the cell is later mutated.
+        packed = self._packed
+        rendered = _RENDERED.get(packed)
+        if rendered is None:
+            rendered = _RENDERED[packed] = f"{{CC1Cell top={self.top} bottom={self.bottom}}}"
+        return rendered
 
     def is_valid(self):
         """Check if this cell is invalid due to illegal buried tiles or invalid codes."""
-        buried = (self.top not in CC1.mobs() and self.bottom != CC1.FLOOR)
-        invalid_code = len({self.top, self.bottom}.intersection(CC1.invalid())) > 0
-        buried_mob = self.bottom in CC1.mobs()
-        return not (buried or invalid_code or buried_mob)
+        packed = self._packed
+        top_flags, bottom_flags = _CATEGORY_FLAGS[packed & 0xFF], _CATEGORY_FLAGS[packed >> 8]
+        # Invalid codes anywhere, or a mob buried on the bottom layer.
+        if (top_flags | bottom_flags) & _INVALID_FLAG or bottom_flags & _MOB_FLAG:
+            return False
+        # Terrain may only be buried under a mob.
+        return bool(top_flags & _MOB_FLAG) or packed >> 8 == CC1.FLOOR
 
     def contains(self, elem):
         """Returns true if elem is present in cell.top or cell.bottom."""
-        return elem in {self.top, self.bottom}
+        packed = self._packed
+        return elem in (packed & 0xFF, packed >> 8)
 
     def add(self, elem):
         """Intelligently add a CC1 tile here, maintaining validity."""
-        is_mob = elem in CC1.mobs()
-        mob_here = self.top in CC1.mobs()
-        if is_mob:
+        packed = self._packed
+        mob_here = _CATEGORY_FLAGS[packed & 0xFF] & _MOB_FLAG
+        if _CATEGORY_FLAGS[elem] & _MOB_FLAG:
             # If adding mob to terrain, move the terrain to the bottom layer.
-            if not mob_here:
-                self.bottom = self.top
-            self.top = elem
+            self._packed = (packed & 0xFF00 if mob_here else packed << 8 & 0xFF00) | elem
+        elif mob_here:
+            # If adding terrain where a mob exists, replace the terrain but not the mob.
+            self._packed = packed & 0xFF | elem << 8
         else:
-            if mob_here:
-                # If adding terrain where a mob exists, replace the terrain but not the mob.
-                self.bottom = elem
-            else:
-                self.top = elem
+            self._packed = packed & 0xFF00 | elem
 
     def remove(self, elem):
         """Intelligently remove a CC1 tile here, maintaining validity. Returns True if cell was
@@ -50,16 +93,16 @@ class CC1Cell:
         if elem == CC1.FLOOR:
             # Floor is default. It can never be removed.
             return False
-        if elem == self.top:
-            self.top = self.bottom
-            self.bottom = CC1.FLOOR
+        packed = self._packed
+        if elem == packed & 0xFF:
+            # The bottom layer moves up and floor fills in beneath it.
+            self._packed = packed >> 8
             return True
-        if elem == self.bottom:
-            self.bottom = CC1.FLOOR
+        if elem == packed >> 8:
+            self._packed = packed & 0xFF
             return True
         return False
 
     def erase(self):
         """Clear cell by setting top and bottom layers to floor."""
-        self.top = CC1.FLOOR
-        self.bottom = CC1.FLOOR
+        self._packed = 0
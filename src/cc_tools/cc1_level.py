@@ -1,14 +1,18 @@
 """Class that represents a CC1 level."""
-import copy
+from .cc1 import CC1, _TILES, _CATEGORY_FLAGS, _MONSTER_FLAG
+from .cc1_map import CC1Map
 
-from .cc1 import CC1
-from .cc1_cell import CC1Cell
+# Every code that names a CC1 element, for checking parsed map planes with bytes.translate().
+_TILE_CODES = bytes(_TILES)
 
 
 class CC1Level:
     """Class that represents a CC1 level."""
 
     # pylint: disable=too-many-instance-attributes
+    __slots__ = ("title", "time", "chips", "hint", "password", "author", "map", "traps", "cloners",
+                 "movement")
+
     def __init__(self, parsed=None):
         self.title = parsed.title if parsed else "Untitled"
         self.time = parsed.time if parsed else 0
@@ -16,19 +20,34 @@ class CC1Level:
         self.hint = parsed.hint if parsed else ""
         self.password = parsed.password if parsed else ""
         self.author = parsed.author if parsed else ""
-        self.map = []
-        for i in range(32 * 32):
-            cell = CC1Cell()
-            if parsed:
-                cell.top, cell.bottom = (CC1(integer) for integer in parsed.map[i])
-            self.map.append(cell)
+        if parsed:
+            # Parsed tile codes go straight into the map planes, without a CC1 per cell. A DAT
+            # layer's final RLE run may overshoot the map, so only the first SIZE cells count.
+            cells = parsed.map[:CC1Map.SIZE]
+            self.map = CC1Map(bytes(top for top, _ in cells), bytes(bottom for _, bottom in cells))
+            unknown = (self.map.top + self.map.bottom).translate(None, _TILE_CODES)
+            if unknown:
+                CC1(unknown[0])  # Raises the ValueError that wrapping the code would have.
+        else:
+            self.map = CC1Map()
         self.traps = {t[0]: t[1] for t in parsed.trap_controls} if parsed else {}
         self.cloners = {t[0]: t[1] for t in parsed.clone_controls} if parsed else {}
         self.movement = list(parsed.movement) if parsed else []
 
+    def __deepcopy__(self, memo):
+        # Every field is immutable or a container of ints, so copying the containers suffices.
+        level = type(self).__new__(type(self))
+        memo[id(self)] = level
+        level.title, level.time, level.chips = self.title, self.time, self.chips
+        level.hint, level.password, level.author = self.hint, self.password, self.author
+        level.map = CC1Map(self.map.top, self.map.bottom)
+        level.traps, level.cloners = dict(self.traps), dict(self.cloners)
+        level.movement = list(self.movement)
+        return level
+
     def __eq__(self, other):
         if type(other) is type(self):
-            return self.__dict__ == other.__dict__
+            return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
         return False
 
     def __str__(self):
@@ -57,16 +76,18 @@ class CC1Level:
 
     def is_valid(self):
         """Returns whether this level map is valid by CC1 rules."""
-        return False not in {cell.is_valid() for cell in self.map}
+        return self.map.is_valid()
 
     def add(self, pos, elem):
         """Add an element at a position, maintaining validity, traps, cloners, and movement."""
         pos = self.__normalize_position(pos)  # If position in (x, y) format convert to y * 32 + x.
-        cell = self.map[pos]
-        old_cell = copy.copy(cell)
-        was_monster = cell.top in CC1.monsters()
-        cell.add(elem)
-        is_monster = cell.top in CC1.monsters()
+        # Snapshot the raw layer codes and classify them via the category flag table.
+        top_layer, bottom_layer = self.map.top, self.map.bottom
+        old_top, old_bottom = top_layer[pos], bottom_layer[pos]
+        was_monster = _CATEGORY_FLAGS[old_top] & _MONSTER_FLAG
+        self.map[pos].add(elem)
+        new_top, new_bottom = top_layer[pos], bottom_layer[pos]
+        is_monster = _CATEGORY_FLAGS[new_top] & _MONSTER_FLAG
 
         # Keep monster movement order in sync.
         if was_monster and not is_monster:
@@ -79,7 +100,7 @@ class CC1Level:
         # Remove trap and cloner connections if they were deleted.
         # Note: If adding traps and cloners, they will NOT be connected here.
         for code in (CC1.TRAP, CC1.TRAP_BUTTON, CC1.CLONER, CC1.CLONE_BUTTON):
-            was_removed = old_cell.contains(code) and not cell.contains(code)
+            was_removed = code in (old_top, old_bottom) and code not in (new_top, new_bottom)
             if was_removed:
                 self.__update_controls(pos, code)
 
@@ -88,7 +109,7 @@ class CC1Level:
         pos = self.__normalize_position(pos)  # If position in (x, y) format convert to y * 32 + x.
         removed = self.map[pos].remove(elem)
         if removed:
-            if elem in CC1.monsters() and pos in self.movement:
+            if _CATEGORY_FLAGS[elem] & _MONSTER_FLAG and pos in self.movement:
                 self.movement.remove(pos)
             self.__update_controls(pos, elem)
 
@@ -98,10 +119,7 @@ class CC1Level:
         elem_set = {elem, } if isinstance(elem, CC1) else set(iter(elem))
         for e in elem_set:
             assert isinstance(e, CC1)
-        count = 0
-        for p in range(32 * 32):
-            count += len(elem_set.intersection({self.map[p].top, self.map[p].bottom}))
-        return count
+        return self.map.count(elem_set)
 
     def __update_controls(self, pos, elem):
         pos = self.__normalize_position(pos)  # If position in (x, y) format convert to y * 32 + x.
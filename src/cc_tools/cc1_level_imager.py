@@ -1,5 +1,7 @@
 """Class that creates images of CC1Levels"""
+import itertools
 import math
+import threading
 
 from PIL import Image
 
@@ -12,9 +14,19 @@ from cc_tools.img_utils import draw_red_line, add_text_label_to_image, \
 class CC1LevelImager:
     """Class that creates images of CC1Levels"""
 
+    # pylint: disable=too-many-instance-attributes
+
+    # Largest tile size drawn by joining raw pixel rows. Small tiles are dominated by the fixed
+    # cost of each Image.paste call; large ones by copying pixels, which paste already does well.
+    JOIN_MAX_TILE_SIZE = 16
+
+    # Sprite sets are loaded from disk once, on first use, and shared by every imager.
+    _shared_sprite_sets = None
+    _sprite_sets_lock = threading.Lock()
+
     # pylint: disable=too-few-public-methods
     def __init__(self):
-        self.sprite_sets = CC1SpriteSet.create_sprite_sets()
+        self.sprite_sets = CC1LevelImager._load_sprite_sets()
         self.sprite_set_name = "default"
         self.sprite_set = self.sprite_sets[self.sprite_set_name]
         self.show_secrets = None
@@ -24,12 +36,25 @@ class CC1LevelImager:
         self.show_monster_order = None
         self.set_show_monster_order(True)
 
+        # Composited (top, bottom) tiles, keyed by everything that affects how they look. Each
+        # entry is [image, raw RGBA pixel rows], with the rows filled in on first request.
+        self.tiles = {}
+
         self.arrows = {}
         sizes = [s.get_size_in_pixels() for s in self.sprite_sets.values()]
         for s in sizes:
             for d in "NESW":
                 self.arrows[f"ARROW_{s}_{d}"] = draw_directional_arrow(s, d)
 
+    @classmethod
+    def _load_sprite_sets(cls):
+        """Return the shared sprite sets, loading them the first time they are needed."""
+        with cls._sprite_sets_lock:
+            sprite_sets = cls._shared_sprite_sets
+            if sprite_sets is None:
+                sprite_sets = cls._shared_sprite_sets = CC1SpriteSet.create_sprite_sets()
+        return sprite_sets
+
     def set_sprite_set(self, sprite_set_name):
         """Set the sprite set to use for level imaging."""
         self.sprite_set_name = sprite_set_name
@@ -54,28 +79,25 @@ class CC1LevelImager:
     def level_image(self, cc1level):
         """Create an 8x8 PNG image from a CC1Level."""
         size = self.sprite_set.get_size_in_pixels()
-        map_img = Image.new("RGBA", (32 * size, 32 * size))
 
-        for j in range(32):
-            for i in range(32):
-                cell = cc1level.map[j * 32 + i]
-                tile_img = self.get_sprite_copy(cell.bottom)
-
-                # If the top layer is different from the bottom, process it.
-                if cell.top != cell.bottom:
-                    self.process_top_layer(cell, tile_img)
-
-                if self.show_monster_order and size >= 32:
-                    # Draw the monster order as a number.
-                    p = i + j * 32
-                    scale = size / 32
-                    if p in cc1level.movement:
-                        index = str(cc1level.movement.index(p))
-                        tile_img = add_text_label_to_image(tile_img, index,
-                                                           (30 * scale,
-                                                            20 * scale))
-
-                map_img.paste(tile_img, (i * size, j * size))
+        if size <= CC1LevelImager.JOIN_MAX_TILE_SIZE:
+            map_img = self.__join_tiles(cc1level, size)
+        else:
+            map_img = Image.new("RGBA", (32 * size, 32 * size))
+            for p in range(32 * 32):
+                map_img.paste(self.get_tile(cc1level.map[p]), (p % 32 * size, p // 32 * size))
+
+        if self.show_monster_order and size >= 32:
+            # Draw the monster order as a number.
+            scale = size / 32
+            for p in dict.fromkeys(cc1level.movement):
+                if not 0 <= p < 32 * 32:
+                    continue
+                index = str(cc1level.movement.index(p))
+                # Label a copy; the composited tile is shared.
+                tile_img = add_text_label_to_image(self.get_tile(cc1level.map[p]).copy(),
+                                                   index, (30 * scale, 20 * scale))
+                map_img.paste(tile_img, (p % 32 * size, p // 32 * size))
 
         if self.show_connections:
             for p1, p2 in list(cc1level.traps.items()) + list(
@@ -88,6 +110,42 @@ class CC1LevelImager:
 
         return map_img
 
+    def __join_tiles(self, cc1level, size):
+        """Lay the map out as raw RGBA pixel rows, joining each tile's cached rows, and decode
+        the whole buffer once instead of pasting 1024 tiles."""
+        pixel_rows = []
+        for j in range(32):
+            tile_rows = [self.get_tile_rows(cc1level.map[j * 32 + i]) for i in range(32)]
+            # zip(*tile_rows) yields pixel row r of every tile in the map row, left to right.
+            pixel_rows.extend(itertools.chain.from_iterable(zip(*tile_rows)))
+        return Image.frombytes("RGBA", (32 * size, 32 * size), b"".join(pixel_rows))
+
+    def get_tile(self, cell):
+        """Get the composited image for a cell. Each distinct (top, bottom) pair is drawn once
+        per sprite set and show_secrets setting; callers must not modify the result."""
+        key = (self.sprite_set_name, self.show_secrets, cell.top, cell.bottom)
+        entry = self.tiles.get(key)
+        if entry is None:
+            tile_img = self.get_sprite_copy(cell.bottom)
+
+            # If the top layer is different from the bottom, process it.
+            if cell.top != cell.bottom:
+                self.process_top_layer(cell, tile_img)
+            entry = self.tiles[key] = [tile_img, None]
+        return entry[0]
+
+    def get_tile_rows(self, cell):
+        """Get the composited image for a cell as a tuple of raw RGBA pixel rows."""
+        key = (self.sprite_set_name, self.show_secrets, cell.top, cell.bottom)
+        entry = self.tiles.get(key)
+        rows = entry[1] if entry else None
+        if rows is None:
+            tile_img = self.get_tile(cell).convert("RGBA")
+            data, stride = tile_img.tobytes(), tile_img.width * 4
+            rows = tuple(data[r:r + stride] for r in range(0, len(data), stride))
+            self.tiles[key][1] = rows
+        return rows
+
     def process_top_layer(self, cell, tile_img):
         """Process the top layer of a cell and paste it onto the tile image."""
         top_img = self.get_sprite_copy(cell.top).convert('RGBA')
@@ -1,10 +1,40 @@
 """Class that transforms CC1Levels"""
 import copy
+import operator
 from enum import Enum
-from .cc1 import CC1
+from .cc1 import CC1, _TILES, _RIGHT_CODES, _REVERSE_CODES, _LEFT_CODES, \
+    _FLIP_HORIZONTAL_CODES, _FLIP_VERTICAL_CODES, _FLIP_NE_SW_CODES, _FLIP_NW_SE_CODES
 from .cc1_cell import CC1Cell
 
 
+def _position_maps(xy_transformer):
+    """Helper: turn an (x, y) transform into (destinations, gather). destinations[p] is where
+    position p moves to, and gather(layer) returns a whole transformed layer in one call."""
+    destinations = tuple(ny * 32 + nx for nx, ny in
+                         (xy_transformer(p % 32, p // 32) for p in range(32 * 32)))
+    sources = [0] * (32 * 32)
+    for p, new_p in enumerate(destinations):
+        sources[new_p] = p
+    return destinations, operator.itemgetter(*sources)
+
+
+def _edit_cells(cc1map, edit):
+    """Helper: apply edit(cell) to every cell of a CC1Map. The outcome only depends on the
+    cell's layers, so edit runs once per distinct (top, bottom) pair and every other cell
+    holding that pair gets the same result written straight into the planes."""
+    results = {}
+    top, bottom = cc1map.top, cc1map.bottom
+    for p, (t, b) in enumerate(zip(top, bottom)):
+        packed = t | b << 8
+        result = results.get(packed)
+        if result is None:
+            cell = CC1Cell(_TILES[t], _TILES[b])
+            edit(cell)
+            result = results[packed] = cell.top | cell.bottom << 8
+        if result != packed:
+            top[p], bottom[p] = result & 0xFF, result >> 8
+
+
 class CC1LevelTransformer:
     """Class that transforms CC1Levels"""
 
@@ -28,14 +58,17 @@ class CC1LevelTransformer:
         Type.FLIP_NW_SE: lambda x, y: (y, x)
     }
 
-    __element_transformer = {
-        Type.R90: lambda e: e.right(),
-        Type.R180: lambda e: e.reverse(),
-        Type.R270: lambda e: e.left(),
-        Type.FLIP_VERTICAL: lambda e: e.flip_vertical(),
-        Type.FLIP_HORIZONTAL: lambda e: e.flip_horizontal(),
-        Type.FLIP_NE_SW: lambda e: e.flip_ne_sw(),
-        Type.FLIP_NW_SE: lambda e: e.flip_nw_se()
+    __position_maps = {_type: _position_maps(xy) for _type, xy in __xy_transformer.items()}
+
+    # Byte tables that transform every tile code of a map layer in one bytes.translate().
+    __element_codes = {
+        Type.R90: _RIGHT_CODES,
+        Type.R180: _REVERSE_CODES,
+        Type.R270: _LEFT_CODES,
+        Type.FLIP_VERTICAL: _FLIP_VERTICAL_CODES,
+        Type.FLIP_HORIZONTAL: _FLIP_HORIZONTAL_CODES,
+        Type.FLIP_NE_SW: _FLIP_NE_SW_CODES,
+        Type.FLIP_NW_SE: _FLIP_NW_SE_CODES
     }
 
     # pylint: disable=too-few-public-methods
@@ -46,28 +79,19 @@ class CC1LevelTransformer:
         if level.count(CC1.PANEL_SE) > 0:
             return new_level
 
-        def transform(o):
-            if isinstance(o, int):
-                x, y = o % 32, o // 32
-                nx, ny = CC1LevelTransformer.__xy_transformer[_type](x, y)
-                return ny * 32 + nx
-            return CC1LevelTransformer.__element_transformer[_type](o)
-
-        for p in range(32 * 32):
-            new_p = transform(p)
-            cell = level.map[p]
-            new_level.map[new_p] = CC1Cell(transform(cell.top), transform(cell.bottom))
+        destinations, gather = CC1LevelTransformer.__position_maps[_type]
+        codes = CC1LevelTransformer.__element_codes[_type]
+        new_level.map.top[:] = gather(level.map.top.translate(codes))
+        new_level.map.bottom[:] = gather(level.map.bottom.translate(codes))
 
         new_level.traps, new_level.cloners = {}, {}
         new_level.movement = []
         for k, v in level.traps.items():
-            nk, nv = (transform(p) for p in (k, v))
-            new_level.traps[nk] = nv
+            new_level.traps[destinations[k]] = destinations[v]
         for k, v in level.cloners.items():
-            nk, nv = (transform(p) for p in (k, v))
-            new_level.cloners[nk] = nv
+            new_level.cloners[destinations[k]] = destinations[v]
         for p in level.movement:
-            new_level.movement.append(transform(p))
+            new_level.movement.append(destinations[p])
         return new_level
 
     @staticmethod
@@ -110,39 +134,57 @@ class CC1LevelTransformer:
         """Replace all CC1 elements in old with element new. Old may be CC1 element or iterable.
         New must be CC1 element. """
         level = copy.deepcopy(level)  # Do not modify original.
+        _edit_cells(level.map, CC1LevelTransformer.__cell_replacer(old, new))
+        return level
+
+    @staticmethod
+    def __cell_replacer(old, new):
+        """Returns a function that applies replace(old, new) to a single cell."""
         assert isinstance(new, CC1), f"Expected CC1 element, got {new}."
         if isinstance(old, CC1):
             old = {old, }
         old = set(old)
-        for p in range(32 * 32):
-            here = level.map[p]
+
+        def replace_cell(here):
             for elem in old:
                 if here.remove(elem):
                     here.add(new)
                 elif elem is CC1.FLOOR:  # Since FLOOR is default, it never gets removed.
                     if here.top is CC1.FLOOR or here.top in CC1.mobs() and here.bottom is CC1.FLOOR:
                         here.add(new)
-        return level
+        return replace_cell
 
     @staticmethod
     def replace_mobs(level, old, new):
         """Replace all mobs in old with those in new, maintaining direction."""
+        replacers = []
         for d in "NESW":
             targets = {mob for mob in old if mob.name.endswith(f"_{d}")}
             replacements = tuple(mob for mob in new if mob.name.endswith(f"_{d}"))
             assert len(replacements) == 1, f"Expected only one matching mob for direction '{d}', " \
                                            f"found {replacements} "
-            level = CC1LevelTransformer.replace(level, targets, replacements[0])
+            replacers.append(CC1LevelTransformer.__cell_replacer(targets, replacements[0]))
+
+        # Replacing touches each cell on its own, so all four directions run in a single pass,
+        # in the same order as four separate replace() calls would apply them.
+        def replace_cell(here):
+            for replacer in replacers:
+                replacer(here)
+
+        level = copy.deepcopy(level)  # Do not modify original.
+        _edit_cells(level.map, replace_cell)
         return level
 
     @staticmethod
     def keep(level, elements_to_keep):
         """Erase everything except for specified elements."""
         level = copy.deepcopy(level)
-        for p in range(32 * 32):
-            here = level.map[p]
+
+        def keep_cell(here):
             present = {here.top, here.bottom}
             trash = present.difference(elements_to_keep)
             for item in trash:
                 here.remove(item)
+
+        _edit_cells(level.map, keep_cell)
         return level
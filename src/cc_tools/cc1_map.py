@@ -0,0 +1,109 @@
+"""Class that represents a 32x32 CC1 map stored as two parallel byte planes."""
+from .cc1 import _CATEGORY_FLAGS, _MOB_FLAG, _INVALID_FLAG
+from .cc1_cell import CC1Cell
+
+# Byte tables for whole-plane checks with bytes.translate. The *_CODES tables list codes to
+# delete, so whatever survives a translate(None, ...) is a violation; the *_BITS tables map
+# each code to 0 or 1 so a plane can be read as one bit per cell.
+_VALID_TOP_CODES = bytes(code for code in range(256) if not _CATEGORY_FLAGS[code] & _INVALID_FLAG)
+_VALID_BOTTOM_CODES = bytes(
+    code for code in range(256) if not _CATEGORY_FLAGS[code] & (_INVALID_FLAG | _MOB_FLAG))
+_MOB_BITS = bytes(1 if flags & _MOB_FLAG else 0 for flags in _CATEGORY_FLAGS)
+_NOT_FLOOR_BITS = bytes(0 if code == 0 else 1 for code in range(256))
+_ZERO_BITS = bytes(1 if code == 0 else 0 for code in range(256))
+
+
+class CC1Map:
+    """Class that represents a 32x32 CC1 map stored as two parallel byte planes.
+
+    The map is laid out structure-of-arrays: `top` and `bottom` are bytearrays holding one
+    tile code per position (y * 32 + x). Indexing returns a CC1Cell view whose layers read
+    from and write through to the planes, so existing CC1Cell code keeps working."""
+
+    SIZE = 32 * 32
+
+    __slots__ = ("top", "bottom")
+
+    def __init__(self, top=None, bottom=None):
+        self.top = bytearray(top) if top is not None else bytearray(CC1Map.SIZE)
+        self.bottom = bytearray(bottom) if bottom is not None else bytearray(CC1Map.SIZE)
+
+    def __copy__(self):
+        return CC1Map(self.top, self.bottom)
+
+    def __deepcopy__(self, memo):
+        return CC1Map(self.top, self.bottom)
+
+    def __eq__(self, other):
+        if type(other) is type(self):
+            return self.top == other.top and self.bottom == other.bottom
+        return False
+
+    def __len__(self):
+        return len(self.top)
+
+    def __getitem__(self, pos):
+        # Indexing through a range normalizes negative positions and raises IndexError up front.
+        if isinstance(pos, slice):
+            # Like slicing a list of cells: a list of views onto the selected positions.
+            return [_CC1MapCell(self, i) for i in range(len(self.top))[pos]]
+        return _CC1MapCell(self, range(len(self.top))[pos])
+
+    def __setitem__(self, pos, cell):
+        if isinstance(pos, slice):
+            # The map has a fixed size, so a slice can only be replaced cell for cell.
+            cells, positions = list(cell), range(len(self.top))[pos]
+            if len(cells) != len(positions):
+                raise ValueError(f"Cannot assign {len(cells)} cells to a slice of "
+                                 f"{len(positions)} map positions.")
+            self.top[pos] = bytes(c.top for c in cells)
+            self.bottom[pos] = bytes(c.bottom for c in cells)
+            return
+        self.top[pos], self.bottom[pos] = cell.top, cell.bottom
+
+    def __iter__(self):
+        for pos in range(len(self.top)):
+            yield _CC1MapCell(self, pos)
+
+    def is_valid(self):
+        """Returns whether every cell is valid by CC1 rules, checking whole planes at once."""
+        # Invalid codes on either layer, or mobs buried on the bottom layer.
+        if self.top.translate(None, _VALID_TOP_CODES) or \
+                self.bottom.translate(None, _VALID_BOTTOM_CODES):
+            return False
+        # Terrain may only be buried under a mob: one bit per cell, compared as big ints.
+        mobs_on_top = int.from_bytes(self.top.translate(_MOB_BITS), "little")
+        buried = int.from_bytes(self.bottom.translate(_NOT_FLOOR_BITS), "little")
+        return not buried & ~mobs_on_top
+
+    def count(self, elements):
+        """Counts the occurrences of the given elements on both layers, scanning whole planes at
+        once. An element stacked on top of itself only counts once."""
+        element_bits = bytearray(256)
+        for elem in elements:
+            element_bits[elem] = 1
+        top, bottom = self.top.translate(element_bits), self.bottom.translate(element_bits)
+        # Cells whose layers hold the same code were counted on both layers; take them off once.
+        size = len(self.top)
+        same = int.from_bytes(self.top, "little") ^ int.from_bytes(self.bottom, "little")
+        same = int.from_bytes(same.to_bytes(size, "little").translate(_ZERO_BITS), "little")
+        stacked = (int.from_bytes(top, "little") & same).to_bytes(size, "little")
+        return top.count(1) + bottom.count(1) - stacked.count(1)
+
+
+class _CC1MapCell(CC1Cell):
+    """CC1Cell view of one position in a CC1Map. Layer reads and writes go to the map."""
+
+    __slots__ = ("_map", "_pos")
+
+    # pylint: disable=super-init-not-called
+    def __init__(self, cc1map, pos):
+        self._map, self._pos = cc1map, pos
+
+    @property
+    def _packed(self):
+        return self._map.top[self._pos] | self._map.bottom[self._pos] << 8
+
+    @_packed.setter
+    def _packed(self, packed):
+        self._map.top[self._pos], self._map.bottom[self._pos] = packed & 0xFF, packed >> 8
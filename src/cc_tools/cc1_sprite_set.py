@@ -171,6 +171,9 @@ class CC1SpriteSet:
         directory = importlib.resources.files(package)
         # Iterate over the directory contents
         for file in directory.iterdir():
+            # Skip non-image entries such as the package's __init__.py
+            if not file.name.lower().endswith(('.bmp', '.png')):
+                continue
             # 'stem' gives the filename without the extension
             filename_without_extension = file.stem
             # Call the factory function for each file
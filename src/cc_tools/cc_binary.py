@@ -2,6 +2,11 @@
 import io
 import struct
 
+# Precompiled little-endian formats, so each write skips the format-string lookup.
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<L")
+
 
 class CCBinary:
     """Custom wrappers for working with io.BytesIO objects."""
@@ -15,20 +20,20 @@ class CCBinary:
 
         def byte(self, byte):
             """Writes a byte to output."""
-            self.bio.write(struct.pack("<B", byte))
+            self.bio.write(_U8.pack(byte))
 
         def short(self, short):
             """Writes a short (2 bytes) to output."""
-            self.bio.write(struct.pack("<H", short))
+            self.bio.write(_U16.pack(short))
 
         def shorts(self, shorts):
             """Writes a sequence of shorts (2 bytes) to output."""
-            for short in shorts:
-                self.short(short)
+            shorts = tuple(shorts)
+            self.bio.write(struct.pack(f"<{len(shorts)}H", *shorts))
 
         def long(self, long):
             """Writes a long (4 bytes) to output."""
-            self.bio.write(struct.pack("<L", long))
+            self.bio.write(_U32.pack(long))
 
         def bytes(self, bytes_to_write):
             """Writes an arbitrary sequence of bytes to output."""
@@ -54,27 +59,37 @@ class CCBinary:
 
         def __init__(self, bytes_to_read):
             self.bio = io.BytesIO(bytes_to_read)
+            # The reader never writes, so its size and contents are fixed once built.
+            self._size = len(bytes_to_read)
+            self._raw = None
 
         def byte(self):
             """Read a byte from IO."""
             byte = self.bio.read(1)
             if len(byte) < 1:
                 raise EOFError("Unexpected end of data while reading a byte.")
-            return struct.unpack("<B", byte)[0]
+            return byte[0]
 
         def short(self):
             """Read a short (2 bytes) from IO."""
             short = self.bio.read(2)
             if len(short) < 2:
                 raise EOFError("Unexpected end of data while reading a short.")
-            return struct.unpack("<H", short)[0]
+            return int.from_bytes(short, "little")
+
+        def shorts(self, n_shorts):
+            """Read n shorts (2 bytes each) from IO as a tuple."""
+            data = self.bio.read(2 * n_shorts)
+            if len(data) < 2 * n_shorts:
+                raise EOFError(f"Unexpected end of data while reading {n_shorts} shorts.")
+            return struct.unpack(f"<{n_shorts}H", data)
 
         def long(self):
             """Read a long (4 bytes) from IO."""
             long_bytes = self.bio.read(4)
             if len(long_bytes) < 4:
                 raise EOFError("Unexpected end of data while reading a long.")
-            return struct.unpack("<L", long_bytes)[0]
+            return int.from_bytes(long_bytes, "little")
 
         def bytes(self, n_bytes):
             """Read n bytes from IO."""
@@ -89,11 +104,11 @@ class CCBinary:
 
         def size(self):
             """The total number of bytes in the reader."""
-            return len(self.bio.getvalue())
+            return self._size
 
         def remaining(self):
             """The number of bytes remaining."""
-            return self.size() - self.current()
+            return self._size - self.bio.tell()
 
         def current(self):
             """The current index of the reader."""
@@ -101,7 +116,9 @@ class CCBinary:
 
         def raw(self):
             """The raw bytes in the reader."""
-            return self.bio.getvalue()
+            if self._raw is None:
+                self._raw = self.bio.getvalue()
+            return self._raw
 
         def seek(self, index):
             """Set the current index of the reader."""
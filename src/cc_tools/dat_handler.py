@@ -1,8 +1,7 @@
 """Classes for retrieving, parsing, and writing CC1 DAT files."""
 import logging
+import re
 from collections import namedtuple
-import requests
-from bs4 import BeautifulSoup
 
 from .cc_binary import CCBinary
 from .cc1_levelset import CC1Levelset
@@ -10,6 +9,9 @@ from .cc1_level import CC1Level
 
 GLIDERBOT_URL = "https://bitbusters.club/gliderbot/sets/cc1/"
 
+# Runs of [4, 255] of one repeated byte, the ones worth run-length encoding.
+_LAYER_RUNS = re.compile(rb"(.)\1{3,254}", re.DOTALL)
+
 ParsedDATLevelset = namedtuple(
     "ParsedDATLevelset",
     ("levels",
@@ -87,6 +89,11 @@ class DATHandler:
     @staticmethod
     def fetch_set_names():
         """Retrieve a tuple of all available sets on Gliderbot."""
+        # Network dependencies are imported here so reading and writing DAT files does not
+        # load them.
+        # pylint: disable=import-outside-toplevel
+        import requests
+        from bs4 import BeautifulSoup
         try:
             # Retrieve the list of all available CC1 sets from Gliderbot.
             soup = BeautifulSoup(
@@ -103,6 +110,8 @@ class DATHandler:
     @staticmethod
     def fetch_set(levelset):
         """Retrieve a DAT levelset by name from Gliderbot and convert to CC1Levelset."""
+        # pylint: disable=import-outside-toplevel
+        import requests
         resp = requests.get(GLIDERBOT_URL + levelset, timeout=10)
         if resp.status_code < 300:
             logging.info("Successfully retrieved %s.", GLIDERBOT_URL + levelset)
@@ -127,9 +136,8 @@ class DATHandler:
         def parse_level(self):
             """Parses raw bytes in DAT format into elements of a CC1 Level."""
             # pylint: disable=too-many-locals
-            self.short()  # level_size_bytes, UNUSED
-            number, time, chips = self.short(), self.short(), self.short()
-            map_detail = self.short()
+            # level_size_bytes is UNUSED
+            _, number, time, chips, map_detail = self.shorts(5)
             top = self.__parse_layer(self.bytes(self.short()))
             bottom = self.__parse_layer(self.bytes(self.short()))
 
@@ -169,46 +177,40 @@ class DATHandler:
 
         @staticmethod
         def __parse_layer(layer_bytes):
-            parser = DATHandler.Parser(layer_bytes)
-            layer = []
+            layer, index = bytearray(), 0
             while len(layer) < 32 * 32:
-                next_byte = parser.byte()
-                if next_byte == 0xFF:  # run length encoding
-                    length, tilecode = parser.byte(), parser.byte()
-                    layer.extend([tilecode] * length)
-                else:
-                    layer.append(next_byte)
+                # Copy the literal run up to the next RLE marker in one slice.
+                marker = layer_bytes.find(0xFF, index)
+                end = len(layer_bytes) if marker == -1 else marker
+                end = min(end, index + 32 * 32 - len(layer))
+                layer += layer_bytes[index:end]
+                index = end
+                if len(layer) >= 32 * 32:
+                    break
+                if index + 3 > len(layer_bytes):
+                    raise EOFError("Unexpected end of data while reading a layer.")
+                # 0xFF marks run length encoding: 0xFF, length, tilecode.
+                length, tilecode = layer_bytes[index + 1], layer_bytes[index + 2]
+                layer += bytes((tilecode,)) * length
+                index += 3
             return tuple(layer)
 
         @staticmethod
         def __parse_traps(traps_bytes):
-            parser = DATHandler.Parser(traps_bytes)
-            controls = []
-            for _ in range(len(traps_bytes) // 10):
-                b_x, b_y = parser.short(), parser.short()
-                t_x, t_y = parser.short(), parser.short()
-                open_or_shut = parser.short()
-                controls.append((b_y * 32 + b_x, t_y * 32 + t_x, open_or_shut))
-            return tuple(controls)
+            shorts = DATHandler.Parser(traps_bytes).shorts(len(traps_bytes) // 10 * 5)
+            return tuple((b_y * 32 + b_x, t_y * 32 + t_x, open_or_shut)
+                         for b_x, b_y, t_x, t_y, open_or_shut in zip(*[iter(shorts)] * 5))
 
         @staticmethod
         def __parse_cloners(cloners_bytes):
-            parser = DATHandler.Parser(cloners_bytes)
-            controls = []
-            for _ in range(len(cloners_bytes) // 8):
-                b_x, b_y = parser.short(), parser.short()
-                c_x, c_y = parser.short(), parser.short()
-                controls.append((b_y * 32 + b_x, c_y * 32 + c_x))
-            return tuple(controls)
+            shorts = DATHandler.Parser(cloners_bytes).shorts(len(cloners_bytes) // 8 * 4)
+            return tuple((b_y * 32 + b_x, c_y * 32 + c_x)
+                         for b_x, b_y, c_x, c_y in zip(*[iter(shorts)] * 4))
 
         @staticmethod
         def __parse_movement(movement_bytes):
-            parser = DATHandler.Parser(movement_bytes)
-            movement = []
-            for _ in range(len(movement_bytes) // 2):
-                monster_x, monster_y = parser.byte(), parser.byte()
-                movement.append(monster_y * 32 + monster_x)
-            return tuple(movement)
+            return tuple(monster_y * 32 + monster_x for monster_x, monster_y
+                         in zip(movement_bytes[0::2], movement_bytes[1::2]))
 
     class Writer(CCBinary.Writer):
         """Class that writes raw bytes in DAT format."""
@@ -330,33 +332,17 @@ class DATHandler:
         @staticmethod
         def write_layers(level_map):
             """Writes and compresses top and bottom layers in a CC1 Level map."""
-            top, bottom = DATHandler.Writer(), DATHandler.Writer()
-            for cell in level_map:
-                top.byte(cell[0])
-                bottom.byte(cell[1])
-            return tuple(DATHandler.Writer.compress_layer(layer.written())
-                         for layer in (top, bottom))
+            top, bottom = bytes(cell[0] for cell in level_map), bytes(cell[1] for cell in level_map)
+            return tuple(DATHandler.Writer.compress_layer(layer) for layer in (top, bottom))
 
         @staticmethod
         def compress_layer(layer):
             """Replaces any substrings containing [4, 255] of the same character with
             Run-Length Encoding"""
-            index = 0
-            writer = DATHandler.Writer()
-            while index < len(layer):
-                c = layer[index]
-                end = index
-                while end + 1 < len(layer) and layer[end + 1] == c and end + 1 - index < 255:
-                    end += 1
-                length = end + 1 - index
-                if length <= 3:
-                    writer.bytes(c.to_bytes(1, 'little') * length)
-                else:
-                    writer.byte(0xff)  # signify RLE
-                    writer.byte(length)
-                    writer.byte(c)
-                index += length
-            return writer.written()
+            # 0xff signifies RLE; everything between runs is copied through as is.
+            return _LAYER_RUNS.sub(
+                lambda run: bytes((0xff, run.end() - run.start(), layer[run.start()])),
+                bytes(layer))
 
         @staticmethod
         def encrypt(input_to_encrypt):
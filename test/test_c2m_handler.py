@@ -19,6 +19,7 @@ Usage:
 import importlib.resources
 import logging
 import os
+import random
 import unittest
 from typing import List, Any
 
@@ -202,6 +203,29 @@ class TestC2MHandlerOnLocalLevels(unittest.TestCase):
         with self.assertRaises(EOFError, msg="Corrupted section length should raise EOFError."):
             C2MHandler.Parser.parse_c2m(corrupted_c2m)
 
+    def test_truncated_packed_data(self):
+        """
+        Test that packed data ending before the declared uncompressed length
+        raises an error instead of returning a short result, and that a back
+        reference with no earlier output is rejected.
+        """
+        packed = C2MHandler.Packer.pack(b"ABCDABCDABCDXYZ")
+        for cut in (0, 1, 3, len(packed) - 1):
+            with self.assertRaises(EOFError, msg=f"Truncated at {cut} should raise EOFError."):
+                C2MHandler.Parser.unpack(packed[:cut])
+        # A back reference with nothing written yet has nothing to copy from.
+        with self.assertRaises(ValueError):
+            C2MHandler.Parser.unpack(bytes([10, 0, 0x83, 3]))
+
+    def test_pack_long_literal_run(self):
+        """
+        Test that a long, mostly incompressible input packs into consecutive data
+        blocks and round-trips, regardless of how many 127-byte blocks it needs.
+        """
+        data = random.Random(2024).randbytes(0xFFFF)
+        packed = C2MHandler.Packer.pack(data)
+        self.assertEqual(C2MHandler.Parser.unpack(packed), data)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
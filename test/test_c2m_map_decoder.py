@@ -78,6 +78,29 @@ class TestC2MMapDecoder(unittest.TestCase):
         # row1 col1 => tile=0x06
         self.assertEqual(grid[1][1].terrain.id, CC2(0x06))
 
+    def test_decoded_cells_use_slots(self):
+        """
+        Decoded cells and elements are slotted dataclasses with no per-instance __dict__.
+        """
+        grid = C2MMapDecoder(bytes([1, 1, CC2.FLOOR.value])).decode()
+        cell = grid[0][0]
+        self.assertFalse(hasattr(cell, "__dict__"))
+        self.assertFalse(hasattr(cell.terrain, "__dict__"))
+        with self.assertRaises(AttributeError):
+            cell.tile_type = CC2.FLOOR
+
+    def test_cell_and_element_repr(self):
+        """
+        repr lists only the fields that are set, in declaration order.
+        """
+        cell = C2MCell(mob=C2MElement(CC2.CHIP, direction="N"), terrain=C2MElement(CC2.FLOOR))
+        self.assertEqual(
+            repr(cell),
+            f"C2MCell(mob=C2MElement(id={CC2.CHIP!r}, direction='N'), "
+            f"terrain=C2MElement(id={CC2.FLOOR!r}))"
+        )
+        self.assertEqual(repr(C2MCell()), "C2MCell()")
+
     def test_decode_modifier_tile(self):
         """
         Test a scenario where we encounter a MODIFIER tile that references another tile.
@@ -1,10 +1,13 @@
 """Tests for CC1."""
+import copy
 import importlib.resources
 import unittest
 from cc_tools.cc1_cell import CC1Cell
 from cc_tools.cc1_level import CC1Level
+from cc_tools.cc1_map import CC1Map
 from cc_tools.cc1_level_transformer import CC1LevelTransformer
 from cc_tools.dat_handler import DATHandler
+from cc_tools import cc1
 from cc_tools.cc1 import CC1, FLIP_HORIZONTAL_MAP, FLIP_VERTICAL_MAP, FLIP_NE_SW_MAP, FLIP_NW_SE_MAP
 
 
@@ -42,6 +45,28 @@ class TestCC1(unittest.TestCase):
         self.assertEqual(len(CC1.buttons()), 4)
         self.assertEqual(len(CC1.toggles()), 2)
 
+    def test_sets_are_shared(self):
+        """Tile code sets are built once and cannot be mutated by callers."""
+        self.assertIsInstance(CC1.mobs(), frozenset)
+        self.assertIs(CC1.mobs(), CC1.mobs())
+        self.assertIs(CC1.monsters(), CC1.monsters())
+
+    def test_category_flags(self):
+        """Per-code category flags agree with the tile code sets."""
+        # pylint:disable=protected-access
+        for code in range(256):
+            flags = cc1._CATEGORY_FLAGS[code]
+            self.assertEqual(bool(flags & cc1._MOB_FLAG), code in CC1.mobs())
+            self.assertEqual(bool(flags & cc1._MONSTER_FLAG), code in CC1.monsters())
+            self.assertEqual(bool(flags & cc1._INVALID_FLAG), code not in CC1.valid())
+
+    def test_int_codes(self):
+        """Tile codes are ints but still render by name."""
+        self.assertEqual(CC1.WALL, 1)
+        self.assertEqual(CC1.PANEL_SE + 0, 48)
+        self.assertEqual(str(CC1.TANK_N), "CC1.TANK_N")
+        self.assertEqual(f"{CC1.FLOOR}", "CC1.FLOOR")
+
     def test_rotations(self):
         """Unit tests for rotating CC1 tiles."""
         # pylint:disable=invalid-name
@@ -286,6 +311,40 @@ class TestCC1Cell(unittest.TestCase):
             for terrain in CC1.nonmobs().difference(CC1.invalid()):
                 self.assertTrue(CC1Cell(mob, terrain).is_valid())
 
+    def test_slots(self):
+        """Cells carry only their two layers, with no per-instance __dict__."""
+        cell = CC1Cell(CC1.PLAYER_S, CC1.EXIT)
+        self.assertFalse(hasattr(cell, "__dict__"))
+        with self.assertRaises(AttributeError):
+            cell.middle = CC1.WALL
+
+    def test_layers(self):
+        """Unit tests for reading and writing the packed top and bottom layers."""
+        cell = CC1Cell(CC1.TANK_E, CC1.ICE_SW)
+        self.assertIs(cell.top, CC1.TANK_E)
+        self.assertIs(cell.bottom, CC1.ICE_SW)
+        cell.bottom = CC1.WATER
+        self.assertEqual((cell.top, cell.bottom), (CC1.TANK_E, CC1.WATER))
+        cell.top = CC1.BLOCK
+        self.assertEqual(cell, CC1Cell(CC1.BLOCK, CC1.WATER))
+        self.assertNotEqual(cell, CC1Cell(CC1.WATER, CC1.BLOCK))
+        with self.assertRaises(TypeError):
+            hash(cell)
+        cell.top, cell.bottom = 200, 150
+        with self.assertRaises(ValueError):
+            _ = cell.top
+        with self.assertRaises(ValueError):
+            _ = cell.bottom
+
+    def test_str(self):
+        """Unit tests for rendering cells, including after they change."""
+        cell = CC1Cell(CC1.TEETH_S, CC1.GRAVEL)
+        self.assertEqual(str(cell), "{CC1Cell top=CC1.TEETH_S bottom=CC1.GRAVEL}")
+        cell.add(CC1.BLOB_S)
+        self.assertEqual(str(cell), "{CC1Cell top=CC1.BLOB_S bottom=CC1.GRAVEL}")
+        cell.erase()
+        self.assertEqual(str(cell), "{CC1Cell top=CC1.FLOOR bottom=CC1.FLOOR}")
+
     def test_contains(self):
         """Unit tests for checking if a cell contains an element."""
         cell = CC1Cell(CC1.PLAYER_S, CC1.EXIT)
@@ -336,6 +395,91 @@ class TestCC1Cell(unittest.TestCase):
         self.assertEqual(cell, CC1Cell())
 
 
+class TestCC1Map(unittest.TestCase):
+    """Tests for CC1Map."""
+
+    def test_cells_write_through(self):
+        """Unit tests for reading and editing the map through cell views."""
+        cc1map = CC1Map()
+        self.assertEqual(len(cc1map), 32 * 32)
+        self.assertEqual(cc1map[5], CC1Cell())
+        cc1map[5].add(CC1.TEETH_S)
+        cc1map[5].add(CC1.GRAVEL)
+        self.assertEqual(cc1map[5], CC1Cell(CC1.TEETH_S, CC1.GRAVEL))
+        self.assertEqual((cc1map.top[5], cc1map.bottom[5]), (CC1.TEETH_S.value, CC1.GRAVEL.value))
+        cc1map[6] = CC1Cell(CC1.WALL)
+        self.assertEqual(list(cc1map)[6], CC1Cell(CC1.WALL))
+
+    def test_slice(self):
+        """Slicing the map returns a list of cell views, like slicing a list of cells."""
+        cc1map = CC1Map()
+        cc1map[33] = CC1Cell(CC1.WALL)
+        row = cc1map[32:64]
+        self.assertEqual(len(row), 32)
+        self.assertEqual(row[1], CC1Cell(CC1.WALL))
+        row[2].add(CC1.TEETH_S)
+        self.assertEqual(cc1map[34], CC1Cell(CC1.TEETH_S))
+        self.assertEqual(cc1map[-1:], [CC1Cell()])
+        self.assertEqual(cc1map[0:3:2], [cc1map[0], cc1map[2]])
+        cc1map[0:2] = [CC1Cell(CC1.WALL), CC1Cell(CC1.BLOB_N, CC1.DIRT)]
+        self.assertEqual(cc1map[0:2], [CC1Cell(CC1.WALL), CC1Cell(CC1.BLOB_N, CC1.DIRT)])
+        cc1map[2:4] = cc1map[0:2]
+        self.assertEqual(cc1map[2:4], [CC1Cell(CC1.WALL), CC1Cell(CC1.BLOB_N, CC1.DIRT)])
+        with self.assertRaises(ValueError):
+            cc1map[0:2] = [CC1Cell()]
+        self.assertEqual(len(cc1map), CC1Map.SIZE)
+
+    def test_index_bounds(self):
+        """Out-of-range positions fail when indexed, not later when the view is read."""
+        cc1map = CC1Map()
+        cc1map[-1] = CC1Cell(CC1.WALL)
+        self.assertEqual(cc1map[CC1Map.SIZE - 1], CC1Cell(CC1.WALL))
+        self.assertEqual(cc1map[-1], CC1Cell(CC1.WALL))
+        for pos in (CC1Map.SIZE, -CC1Map.SIZE - 1, 5000):
+            with self.assertRaises(IndexError):
+                _ = cc1map[pos]
+            with self.assertRaises(IndexError):
+                cc1map[pos] = CC1Cell()
+
+    def test_copy(self):
+        """Unit tests for copying maps and snapshotting cells."""
+        cc1map = CC1Map()
+        cc1map[0] = CC1Cell(CC1.BLOB_N, CC1.DIRT)
+        snapshot = copy.copy(cc1map[0])
+        duplicate = copy.deepcopy(cc1map)
+        self.assertEqual(duplicate, cc1map)
+        cc1map[0].erase()
+        self.assertEqual(snapshot, CC1Cell(CC1.BLOB_N, CC1.DIRT))
+        self.assertEqual(duplicate[0], CC1Cell(CC1.BLOB_N, CC1.DIRT))
+        self.assertNotEqual(duplicate, cc1map)
+
+    def test_is_valid(self):
+        """Whole-map validity agrees with checking every cell."""
+        for top, bottom in ((CC1.WALL, CC1.FLOOR), (CC1.TEETH_S, CC1.GRAVEL),
+                            (CC1.FLOOR, CC1.GRAVEL), (CC1.WALL, CC1.TEETH_S),
+                            (CC1.NOT_USED_0, CC1.FLOOR), (CC1.BLOCK, min(CC1.invalid()))):
+            cc1map = CC1Map()
+            cc1map[1023] = CC1Cell(top, bottom)
+            self.assertEqual(cc1map.is_valid(), CC1Cell(top, bottom).is_valid())
+        dat_file_path = importlib.resources.files('cc_tools.sets.dat') / 'CCLP1.dat'
+        with open(dat_file_path, 'rb') as f:
+            cclp1 = DATHandler.parse(f.read())
+        for level in cclp1.levels:
+            self.assertEqual(level.map.is_valid(), all(cell.is_valid() for cell in level.map))
+
+    def test_count(self):
+        """Counting covers both layers and counts an element stacked on itself once."""
+        cc1map = CC1Map()
+        cc1map[0] = CC1Cell(CC1.TANK_N, CC1.WALL)
+        cc1map[1] = CC1Cell(CC1.WALL, CC1.WALL)
+        cc1map[2] = CC1Cell(CC1.TANK_S, CC1.TANK_S)
+        self.assertEqual(cc1map.count({CC1.WALL}), 2)
+        self.assertEqual(cc1map.count({CC1.WALL, CC1.TANK_N}), 3)
+        self.assertEqual(cc1map.count(CC1.tanks()), 2)
+        self.assertEqual(cc1map.count({CC1.FLOOR}), CC1Map.SIZE - 3)
+        self.assertEqual(cc1map.count(()), 0)
+
+
 class TestCC1Level(unittest.TestCase):
     """Tests for CC1Level."""
 
@@ -346,6 +490,51 @@ class TestCC1Level(unittest.TestCase):
         level.map[0] = CC1Cell(CC1.NOT_USED_0)
         self.assertFalse(level.is_valid())
 
+    def test_slots_and_eq(self):
+        """Levels have no per-instance __dict__ and compare equal field by field."""
+        level = CC1Level()
+        self.assertFalse(hasattr(level, "__dict__"))
+        other = copy.deepcopy(level)
+        self.assertEqual(level, other)
+        other.add(5, CC1.TANK_N)
+        self.assertNotEqual(level, other)
+        level.add(5, CC1.TANK_N)
+        self.assertEqual(level, other)
+        level.title = "Renamed"
+        self.assertNotEqual(level, other)
+
+        class NamedLevel(CC1Level):
+            """Subclass used to check that copies keep their type."""
+            __slots__ = ()
+        self.assertIs(type(copy.deepcopy(NamedLevel())), NamedLevel)
+
+    def test_load_parsed_map(self):
+        """Parsed tile codes load into the map as CC1 elements; unknown codes are rejected."""
+        dat_file_path = importlib.resources.files('cc_tools.sets.dat') / 'CCLP1.dat'
+        with open(dat_file_path, 'rb') as f:
+            parsed = DATHandler.parse(f.read(), as_tuple=True).levels[0]
+        level = CC1Level(parsed)
+        self.assertEqual(tuple((cell.top, cell.bottom) for cell in level.map), parsed.map)
+        self.assertIsInstance(level.map[0].top, CC1)
+        with self.assertRaises(ValueError):
+            CC1Level(parsed._replace(map=((200, CC1.FLOOR),) + parsed.map[1:]))
+
+    def test_load_overlong_parsed_map(self):
+        """A final RLE run past the end of the map is dropped when the level is loaded."""
+        writer = DATHandler.Writer()
+        writer.shorts((0, 1, 100, 0, 1))
+        for tile in (CC1.WALL, CC1.FLOOR):
+            layer = bytes([0xFF, 255, tile] * 4 + [0xFF, 10, tile])  # 1030 cells
+            writer.short(len(layer))
+            writer.bytes(layer)
+        writer.short(0)
+        parsed = DATHandler.Parser(writer.written()).parse_level()
+        self.assertEqual(len(parsed.map), 1030)
+        level = CC1Level(parsed)
+        self.assertEqual(len(level.map), CC1Map.SIZE)
+        self.assertEqual(level.count({CC1.WALL}), CC1Map.SIZE)
+        self.assertEqual(len(DATHandler.Writer.serialize(level).map), CC1Map.SIZE)
+
     def test_add(self):
         """Unit tests for adding elements to levels."""
         level = CC1Level()
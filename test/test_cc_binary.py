@@ -39,6 +39,13 @@ class TestCCBinary(unittest.TestCase):
         self.assertEqual(r.short(), 300)
         self.assertEqual(r.remaining(), 0)
 
+        r = CCBinary.Reader(data)
+        self.assertEqual(r.shorts(3), (100, 200, 300))
+        self.assertEqual(r.remaining(), 0)
+        r.seek(2)
+        with self.assertRaises(EOFError):
+            r.shorts(3)
+
     def test_write_and_read_long(self):
         """Test writing and reading a long integer."""
         w = CCBinary.Writer()